@@ -5,11 +5,18 @@ from pathlib import Path
 import yaml
 
 
+# Top-level sections of the enterprise config held as attributes
+_ENTERPRISE_SECTIONS = (
+    "enterprise", "network", "users", "user_profiles",
+    "traffic", "shadow_it", "junk_traffic", "output",
+)
+
+
 class EnterpriseConfig:
     """Enterprise configuration."""
     
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
+        # The loaded dict is not kept; data rebuilds it on demand
         self.enterprise = data.get("enterprise", {})
         self.network = data.get("network", {})
         self.users = data.get("users", {})
@@ -18,12 +25,22 @@ class EnterpriseConfig:
         self.shadow_it = data.get("shadow_it", {})
         self.junk_traffic = data.get("junk_traffic", {})
         self.output = data.get("output", {})
+        # Any other top-level keys (user_behavior, policies, ...) as loaded
+        self.extra = {key: value for key, value in data.items() if key not in _ENTERPRISE_SECTIONS}
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Full configuration: the known sections plus any other top-level keys."""
+        data = {section: getattr(self, section) for section in _ENTERPRISE_SECTIONS}
+        data.update(self.extra)
+        return data
     
     @classmethod
     def from_yaml(cls, path: Path) -> "EnterpriseConfig":
         """Load configuration from YAML file."""
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            # libyaml-backed loader when PyYAML was built with it
+            data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         return cls(data)
     
     @classmethod
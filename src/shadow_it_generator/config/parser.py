@@ -5,9 +5,11 @@ This module handles loading and parsing YAML configuration files,
 validating their structure, and converting them to internal models.
 """
 
+import json
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from .models import EnterpriseConfig, CloudService
@@ -16,6 +18,48 @@ from .validators import validate_enterprise_config, validate_service_config
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Below this many files, process startup costs more than parsing in parallel saves
+_PARALLEL_MIN_FILES = 32
+
+# Consolidated service definitions, one JSON object per line, written by
+# ConfigParser.consolidate_services next to the YAML files
+SERVICES_JSONL = "services.jsonl"
+
+# Suffix of the manifest written next to a JSONL file, recording the YAML
+# files it was built from
+_MANIFEST_SUFFIX = ".manifest.json"
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file with the fastest available safe loader."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _try_load_yaml(path: Path) -> Tuple[Optional[Any], Optional[str]]:
+    """Load a YAML file, returning (data, None) or (None, error message)."""
+    try:
+        return _load_yaml(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _manifest_path(jsonl_path: Path) -> Path:
+    """Path of the manifest belonging to a consolidated JSONL file."""
+    return jsonl_path.with_suffix(_MANIFEST_SUFFIX)
+
+
+def _file_manifest(files: List[Path]) -> Dict[str, List[int]]:
+    """Map each file name to its [mtime in ns, size in bytes]."""
+    manifest = {}
+    for path in files:
+        stat = path.stat()
+        manifest[path.name] = [stat.st_mtime_ns, stat.st_size]
+    return manifest
+
 
 class ConfigParser:
     """Parser for YAML configuration files."""
@@ -36,8 +80,7 @@ class ConfigParser:
         """
         logger.info(f"Parsing enterprise config from {config_path}")
         
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(config_path)
             
         # Validate configuration
         validate_enterprise_config(data)
@@ -59,16 +102,28 @@ class ConfigParser:
         
         services = []
         
-        # Find all YAML files
-        yaml_files = list(services_dir.glob("*.yaml")) + list(services_dir.glob("*.yml"))
+        # Find all YAML files, skipping example files
+        yaml_files = self._service_yaml_files(services_dir)
         
-        for yaml_file in yaml_files:
-            # Skip example files
-            if yaml_file.name.endswith('.example'):
-                continue
-                
+        # A consolidated JSONL file is much faster to parse than the YAML
+        # files; use it only while they are exactly the files it was built from
+        jsonl_path = services_dir / SERVICES_JSONL
+        if self._jsonl_matches(jsonl_path, yaml_files):
+            return self.parse_services_jsonl(jsonl_path)
+        
+        # YAML parsing is CPU-bound, so large directories are parsed across
+        # processes; models are still built here from the returned dicts
+        if len(yaml_files) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                loaded = list(executor.map(_try_load_yaml, yaml_files, chunksize=8))
+        else:
+            loaded = [_try_load_yaml(yaml_file) for yaml_file in yaml_files]
+        
+        for yaml_file, (data, error) in zip(yaml_files, loaded):
             try:
-                service = self.parse_service_config(yaml_file)
+                if error is not None:
+                    raise ValueError(error)
+                service = self._build_service_config(data)
                 services.append(service)
                 logger.debug(f"Loaded service: {service.name}")
             except Exception as e:
@@ -77,6 +132,99 @@ class ConfigParser:
         logger.info(f"Loaded {len(services)} cloud services")
         return services
     
+    def parse_services_jsonl(self, jsonl_path: Path) -> List[CloudService]:
+        """
+        Parse cloud services from a consolidated JSONL file.
+        
+        Args:
+            jsonl_path: File with one service definition per line
+            
+        Returns:
+            List of parsed cloud service configurations
+        """
+        services = []
+        
+        with open(jsonl_path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    service = self._build_service_config(json.loads(line))
+                    services.append(service)
+                    logger.debug(f"Loaded service: {service.name}")
+                except Exception as e:
+                    logger.warning(f"Failed to parse {jsonl_path}:{line_number}: {str(e)}")
+        
+        logger.info(f"Loaded {len(services)} cloud services from {jsonl_path}")
+        return services
+    
+    def consolidate_services(self, services_dir: Path, output_path: Optional[Path] = None) -> Path:
+        """
+        Write all service YAML files in a directory to one JSONL file.
+        
+        A manifest of the YAML files' names, modification times and sizes
+        is written alongside. parse_services_directory picks the JSONL file
+        up automatically while the directory still matches that manifest.
+        
+        Args:
+            services_dir: Directory containing service YAML files
+            output_path: Destination (default: services.jsonl in services_dir)
+            
+        Returns:
+            Path of the written file
+            
+        Raises:
+            ValueError: If a service definition holds values JSON cannot
+                represent exactly, such as dates or non-string keys
+        """
+        output_path = output_path or services_dir / SERVICES_JSONL
+        manifest_path = _manifest_path(output_path)
+        
+        yaml_files = self._service_yaml_files(services_dir)
+        manifest = _file_manifest(yaml_files)
+        
+        lines = []
+        for yaml_file in yaml_files:
+            data, error = _try_load_yaml(yaml_file)
+            if error is not None:
+                logger.warning(f"Skipping {yaml_file}: {error}")
+                continue
+            try:
+                line = json.dumps(data)
+            except TypeError as e:
+                raise ValueError(f"{yaml_file} cannot be stored as JSON: {e}") from e
+            # JSON silently turns non-string keys into strings
+            if json.loads(line) != data:
+                raise ValueError(f"{yaml_file} does not round-trip through JSON")
+            lines.append(line)
+        
+        # Drop the old manifest first so a failed write never looks current
+        manifest_path.unlink(missing_ok=True)
+        with open(output_path, 'w') as out:
+            out.writelines(line + '\n' for line in lines)
+        with open(manifest_path, 'w') as out:
+            json.dump(manifest, out)
+        
+        return output_path
+    
+    @staticmethod
+    def _jsonl_matches(jsonl_path: Path, yaml_files: List[Path]) -> bool:
+        """Whether a consolidated JSONL file was built from exactly these YAML files."""
+        manifest_path = _manifest_path(jsonl_path)
+        if not jsonl_path.exists() or not manifest_path.exists():
+            return False
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f) == _file_manifest(yaml_files)
+        except (OSError, ValueError):
+            return False
+    
+    @staticmethod
+    def _service_yaml_files(services_dir: Path) -> List[Path]:
+        """List service YAML files in a directory, skipping example files."""
+        yaml_files = list(services_dir.glob("*.yaml")) + list(services_dir.glob("*.yml"))
+        return [f for f in yaml_files if not f.name.endswith('.example')]
+    
     def parse_service_config(self, config_path: Path) -> CloudService:
         """
         Parse a single cloud service configuration file.
@@ -87,9 +235,18 @@ class ConfigParser:
         Returns:
             Parsed cloud service configuration
         """
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+        return self._build_service_config(_load_yaml(config_path))
+    
+    def _build_service_config(self, data: Dict[str, Any]) -> CloudService:
+        """
+        Validate loaded service data and convert it to a model.
+        
+        Args:
+            data: Parsed contents of a service YAML file
             
+        Returns:
+            Cloud service configuration
+        """
         # Validate configuration
         validate_service_config(data)
         
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
+import math
 import uuid
 import random
 
@@ -27,6 +28,32 @@ from ..core.user import User
 logger = logging.getLogger(__name__)
 
 
+def _apportion(total: int, shares: List[float]) -> List[int]:
+    """
+    Split a total into integer counts using the largest-remainder method.
+    
+    Each bucket gets the floor of its ideal share, and the seats lost to
+    rounding go to the buckets with the largest fractional remainders, so
+    the counts add up to the rounded sum of the ideal shares.
+    
+    Args:
+        total: Number of items to distribute
+        shares: Fraction of the total for each bucket
+        
+    Returns:
+        Integer count per bucket, in the same order as shares
+    """
+    ideal = [total * share for share in shares]
+    counts = [math.floor(x) for x in ideal]
+    remaining = round(sum(ideal)) - sum(counts)
+    
+    by_remainder = sorted(range(len(shares)), key=lambda i: ideal[i] - counts[i], reverse=True)
+    for i in by_remainder[:remaining]:
+        counts[i] += 1
+    
+    return counts
+
+
 class LogGenerationEngine:
     """
     Main engine for generating shadow IT logs.
@@ -151,15 +178,17 @@ class LogGenerationEngine:
         
         # Generate user identities
         user_data = self.user_generator.generate_users(total_users)
+        source_ips = self.ip_generator.generate_internal_ips(len(user_data))
         
         # Create User objects with profiles
         users = []
         user_id = 1
         
-        for profile in self.enterprise_config.user_profiles:
-            # Calculate number of users for this profile
-            profile_count = int(total_users * profile.get('percentage', 0.1))
-            
+        # Calculate number of users for each profile
+        profiles = self.enterprise_config.user_profiles
+        profile_counts = _apportion(total_users, [p.get('percentage', 0.1) for p in profiles])
+        
+        for profile, profile_count in zip(profiles, profile_counts):
             for i in range(profile_count):
                 if user_id > len(user_data):
                     break
@@ -173,7 +202,7 @@ class LogGenerationEngine:
                     username=user_info['username'],
                     full_name=user_info['full_name'],
                     profile=profile,
-                    source_ip=self.ip_generator.generate_internal_ip(),
+                    source_ip=source_ips[user_id - 1],
                     locale=user_info['locale']
                 )
                 
@@ -200,6 +229,10 @@ class LogGenerationEngine:
             # Generate user sessions for this hour
             user_sessions = self.activity_generator.generate_hourly_activity(users, hour_start)
             
+            # Events are collected for the whole hour and handed to each
+            # formatter as one batch, so lines are written in large chunks
+            hour_events: List[LogEvent] = []
+            
             # Process each user's sessions
             for user_id, sessions in user_sessions.items():
                 user = next(u for u in users if u.id == user_id)
@@ -210,18 +243,15 @@ class LogGenerationEngine:
                     
                     # Convert requests to log events
                     for request in requests:
-                        log_event = self._create_log_event(user, session, request)
-                        
-                        # Write to all formatters
-                        for formatter in self.formatters:
-                            formatter.write_event(log_event)
+                        hour_events.append(self._create_log_event(user, session, request))
                 
                 # Generate junk traffic for active users
                 if self.junk_generator and self.activity_generator.should_generate_junk_traffic(user, hour_start):
-                    junk_events = self._generate_user_junk_traffic(user, hour_start)
-                    for event in junk_events:
-                        for formatter in self.formatters:
-                            formatter.write_event(event)
+                    hour_events.extend(self._generate_user_junk_traffic(user, hour_start))
+            
+            # Write to all formatters
+            for formatter in self.formatters:
+                formatter.write_batch(hour_events)
     
     def _create_log_event(self, user: User, session: Any, request: Dict[str, Any]) -> LogEvent:
         """Convert a session request to a log event."""
@@ -16,6 +16,11 @@ from ..formatters.base import LogEvent
 from .user import User
 
 
+# Status codes for successful and failed requests, picked uniformly
+_SUCCESS_CODES = (200, 304)
+_ERROR_CODES = (400, 401, 404, 500, 503)
+
+
 @dataclass
 class Session:
     """
@@ -267,12 +272,16 @@ class Session:
     
     def _get_status_code(self) -> int:
         """Get HTTP status code for request."""
+        # One draw picks both the outcome and the code: within each band
+        # the rescaled draw is uniform again
+        r = random.random()
+        
         # Most requests succeed
-        if random.random() < 0.95:
-            return random.choice([200, 304])  # OK or Not Modified
+        if r < 0.95:
+            return _SUCCESS_CODES[min(int(r / 0.95 * 2), 1)]  # OK or Not Modified
         else:
             # Occasional errors
-            return random.choice([400, 401, 404, 500, 503])
+            return _ERROR_CODES[min(int((r - 0.95) / 0.05 * 5), 4)]
     
     def _get_duration_ms(self, action_name: str) -> int:
         """Get request duration in milliseconds."""
@@ -32,6 +32,9 @@ class TrafficGenerator:
         """
         self.config = enterprise_config
         self.working_hours = self._parse_working_hours()
+        # Working-hours flag for each hour of the day, indexed by hour
+        start, end = self.working_hours
+        self._work_mask = tuple(start <= h < end for h in range(24))
         # Get peak hours from traffic config
         self.peak_hours = enterprise_config.traffic.get('peak_hours', [9, 10, 11, 14, 15, 16])
     
@@ -85,7 +88,7 @@ class TrafficGenerator:
             base_factor = 1.0
         
         # Time of day adjustment
-        if self._is_working_hours(hour_of_day):
+        if self._work_mask[hour_of_day]:
             # Working hours activity
             if hour_of_day in self.peak_hours:
                 time_factor = 1.0
@@ -108,8 +111,7 @@ class TrafficGenerator:
         Returns:
             True if within working hours
         """
-        start, end = self.working_hours
-        return start <= hour < end
+        return self._work_mask[hour]
     
     def _parse_working_hours(self) -> Tuple[int, int]:
         """Parse working hours from configuration.
@@ -174,7 +176,7 @@ class TrafficGenerator:
             base_weight = 1.5  # Power users more likely to be active
         elif user.user_type == UserType.RISKY:
             # Risky users have irregular patterns
-            if self._is_working_hours(hour_of_day):
+            if self._work_mask[hour_of_day]:
                 base_weight = 1.2
             else:
                 base_weight = 2.0  # More likely after hours
@@ -182,7 +184,7 @@ class TrafficGenerator:
             base_weight = 1.0
         
         # Department-based adjustments
-        if user.department == 'IT' and not self._is_working_hours(hour_of_day):
+        if user.department == 'IT' and not self._work_mask[hour_of_day]:
             base_weight *= 1.5  # IT more likely to work off-hours
         elif user.department == 'Sales' and hour_of_day in self.peak_hours:
             base_weight *= 1.2  # Sales more active during peak
@@ -5,16 +5,17 @@ This module defines user entities with their behavior profiles,
 service assignments, and activity patterns.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, time
 import random
 import numpy as np
 
 from ..config.models import UserProfile, CloudService
+from ..utils.compat import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class User:
     """
     Represents a single user in the enterprise.
@@ -40,29 +41,59 @@ class User:
     daily_request_count: int = 0
     sessions_today: int = 0
     
-    # User-specific patterns
-    work_start_time: time = field(default_factory=lambda: time(8, random.randint(0, 59)))
-    work_end_time: time = field(default_factory=lambda: time(17, random.randint(0, 59)))
-    lunch_time: time = field(default_factory=lambda: time(12, random.randint(0, 59)))
-    
     # Device preferences
     preferred_user_agent: Optional[str] = None
     mobile_probability: float = 0.2  # 20% chance of mobile usage
     
+    # Backing slots for the lazily drawn work pattern times
+    _work_start_time: Optional[time] = field(default=None, init=False, repr=False)
+    _work_end_time: Optional[time] = field(default=None, init=False, repr=False)
+    _lunch_time: Optional[time] = field(default=None, init=False, repr=False)
+    
     def __post_init__(self):
         """Initialize user-specific patterns based on profile."""
-        # Adjust work hours based on profile
+        # Adjust device preferences based on profile
         if self.profile.name == "power_user":
-            # Power users often work longer hours
-            self.work_start_time = time(7, random.randint(30, 59))
-            self.work_end_time = time(18, random.randint(0, 59))
             self.mobile_probability = 0.3
         elif self.profile.name == "risky":
-            # Risky users have irregular hours
-            self.work_start_time = time(random.randint(6, 10), random.randint(0, 59))
-            self.work_end_time = time(random.randint(16, 20), random.randint(0, 59))
             self.mobile_probability = 0.4
     
+    # User-specific work patterns are drawn lazily on first access, so
+    # users that are never active do not pay for them.
+    
+    @property
+    def work_start_time(self) -> time:
+        """Time this user usually starts work."""
+        if self._work_start_time is None:
+            if self.profile.name == "power_user":
+                # Power users often work longer hours
+                self._work_start_time = time(7, random.randint(30, 59))
+            elif self.profile.name == "risky":
+                # Risky users have irregular hours
+                self._work_start_time = time(random.randint(6, 10), random.randint(0, 59))
+            else:
+                self._work_start_time = time(8, random.randint(0, 59))
+        return self._work_start_time
+    
+    @property
+    def work_end_time(self) -> time:
+        """Time this user usually finishes work."""
+        if self._work_end_time is None:
+            if self.profile.name == "power_user":
+                self._work_end_time = time(18, random.randint(0, 59))
+            elif self.profile.name == "risky":
+                self._work_end_time = time(random.randint(16, 20), random.randint(0, 59))
+            else:
+                self._work_end_time = time(17, random.randint(0, 59))
+        return self._work_end_time
+    
+    @property
+    def lunch_time(self) -> time:
+        """Time this user usually takes lunch."""
+        if self._lunch_time is None:
+            self._lunch_time = time(12, random.randint(0, 59))
+        return self._lunch_time
+    
     def assign_services(self, available_services: List[CloudService]) -> None:
         """
         Assign cloud services to this user based on their profile.
@@ -5,14 +5,80 @@ Defines the interface that all log formatters must implement and
 common functionality for formatting log events.
 """
 
+import mmap
+import os
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import ClassVar, Dict, Any, List, Optional
+from dataclasses import field
 
+from ..utils.compat import slotted_dataclass
 
-@dataclass
+
+# Size of the userland write buffer for log files. Formatted lines are only
+# handed to the kernel when the buffer fills up or the formatter is finalized.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Log files are opened in binary mode and lines are encoded explicitly,
+# skipping the TextIOWrapper layer on the write path.
+LOG_ENCODING = 'utf-8'
+
+# Batches with at least this many lines are appended through a memory map
+# instead of a buffered write; below it the buffered writer is faster.
+MMAP_MIN_LINES = 10_000
+
+
+@lru_cache(maxsize=64)
+def log_file_path(output_dir: Path, prefix: str, day: date) -> Path:
+    """
+    Build the path of the daily log file for a formatter.
+    
+    Args:
+        output_dir: Directory holding the formatter's log files
+        prefix: File name prefix, e.g. 'cef' or 'leef'
+        day: Calendar day the file covers
+        
+    Returns:
+        Path of the form <output_dir>/<prefix>_YYYYMMDD.log
+    """
+    return output_dir / f"{prefix}_{day:%Y%m%d}.log"
+
+
+def append_lines(filepath: Path, lines: List[str]) -> None:
+    """
+    Append formatted lines to a log file in a single operation.
+    
+    Large batches grow the file once and copy the encoded block into a
+    memory map of the new region, leaving writeback to the kernel.
+    
+    Args:
+        filepath: Log file to append to (created if missing)
+        lines: Formatted lines without trailing newlines
+    """
+    if not lines:
+        return
+    
+    data = ('\n'.join(lines) + '\n').encode(LOG_ENCODING)
+    
+    if len(lines) < MMAP_MIN_LINES:
+        with open(filepath, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        return
+    
+    with open(filepath, 'a+b') as f:
+        start = f.seek(0, os.SEEK_END)
+        os.ftruncate(f.fileno(), start + len(data))
+        
+        # mmap offsets must be aligned to the allocation granularity
+        offset = start - start % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(f.fileno(), start + len(data) - offset, offset=offset) as mm:
+            mm[start - offset:] = data
+
+
+@slotted_dataclass
 class LogEvent:
     """
     Represents a single log event to be formatted.
@@ -41,6 +107,15 @@ class LogEvent:
     service_name: Optional[str] = None
     protocol: str = "https"
     additional_fields: Optional[Dict[str, Any]] = None
+    event_type: Optional[str] = None  # auth, malware, dlp
+    # Milliseconds since the epoch, when the producer already has them
+    timestamp_ms: Optional[int] = field(default=None, repr=False)
+    
+    def epoch_ms(self) -> int:
+        """Milliseconds since the epoch, derived from timestamp unless supplied."""
+        if self.timestamp_ms is None:
+            self.timestamp_ms = int(self.timestamp.timestamp() * 1000)
+        return self.timestamp_ms
 
 
 class LogFormatter(ABC):
@@ -48,8 +123,13 @@ class LogFormatter(ABC):
     Abstract base class for log formatters.
     
     All log format implementations should inherit from this class.
+    Subclasses implement format_event and set _filename_prefix; daily
+    file rotation and writing are shared.
     """
     
+    # Prefix of the daily log files, e.g. 'cef' -> cef_YYYYMMDD.log
+    _filename_prefix: ClassVar[str]
+    
     def __init__(self, output_dir: Path):
         """
         Initialize the formatter.
@@ -59,6 +139,8 @@ class LogFormatter(ABC):
         """
         self.output_dir = output_dir
         self._file_handle = None
+        self.current_file = None
+        self.current_date = None
         
     def setup(self) -> None:
         """Setup the formatter and create output directory."""
@@ -77,17 +159,69 @@ class LogFormatter(ABC):
         """
         pass
         
-    @abstractmethod
+    def format_event_bytes(self, event: LogEvent) -> bytes:
+        """
+        Format a single log event as an encoded, newline-terminated line.
+        
+        Args:
+            event: The event to format
+            
+        Returns:
+            Formatted log line as bytes
+        """
+        return (self.format_event(event) + '\n').encode(LOG_ENCODING)
+    
     def write_event(self, event: LogEvent) -> None:
         """
-        Write a formatted event to the output file.
+        Write a formatted event to the appropriate log file.
+        
+        Log files are organized by date: <prefix>_YYYYMMDD.log
         
         Args:
             event: The event to write
         """
-        pass
+        # Determine file name based on event date
+        event_date = event.timestamp.date()
+        
+        # Check if we need to open a new file
+        if self.current_date != event_date or self._file_handle is None:
+            # Close previous file if open
+            if self._file_handle:
+                self._file_handle.close()
+            
+            # Open new file
+            filepath = log_file_path(self.output_dir, self._filename_prefix, event_date)
+            self._file_handle = open(filepath, 'ab', buffering=WRITE_BUFFER_SIZE)
+            self.current_date = event_date
+            self.current_file = filepath
+        
+        # Format and write the event
+        self._file_handle.write(self.format_event_bytes(event))
+    
+    def write_batch(self, events: List[LogEvent]) -> None:
+        """
+        Write a batch of events efficiently.
+        
+        Args:
+            events: List of events to write
+        """
+        # Group events by date
+        events_by_date = defaultdict(list)
+        for event in events:
+            events_by_date[event.timestamp.date()].append(event)
+        
+        # Keep ordering with anything still buffered by write_event
+        if self._file_handle:
+            self._file_handle.flush()
+        
+        # Append each group in a single operation
+        for day, day_events in sorted(events_by_date.items()):
+            filepath = log_file_path(self.output_dir, self._filename_prefix, day)
+            append_lines(filepath, [self.format_event(event) for event in day_events])
         
     def finalize(self) -> None:
-        """Cleanup and close any open file handles."""
+        """Flush buffered output and close any open file handles."""
         if self._file_handle:
-            self._file_handle.close()
\ No newline at end of file
+            self._file_handle.flush()
+            self._file_handle.close()
+            self._file_handle = None
\ No newline at end of file
@@ -20,6 +20,41 @@ class CEFFormatter(LogFormatter):
     CEF:Version|Device Vendor|Device Product|Device Version|Device Event Class ID|Name|Severity|Extension
     """
     
+    _filename_prefix = "cef"
+    
+    # Escape tables for single-pass str.translate
+    _HEADER_TABLE = str.maketrans({'\\': '\\\\', '|': '\\|'})
+    _EXT_TABLE = str.maketrans({'\\': '\\\\', '=': '\\=', '\n': '\\n', '\r': '\\r'})
+    
+    # Event classification lookups
+    _REJECTED_ACTIONS = frozenset({"blocked", "denied"})
+    _EVENT_TYPE_CLASS_IDS = {"auth": "102", "malware": "103", "dlp": "104"}
+    
+    # Severity by (action, risk level), with a per-action fallback for
+    # unrecognised risk levels
+    _SEVERITY = {
+        ("allowed", "low"): 1, ("allowed", "medium"): 3, ("allowed", "high"): 4,
+        ("blocked", "low"): 5, ("blocked", "medium"): 6, ("blocked", "high"): 8,
+        ("denied", "low"): 5, ("denied", "medium"): 6, ("denied", "high"): 8,
+    }
+    _DEFAULT_SEVERITY = {"allowed": 4, "blocked": 5, "denied": 5}
+    
+    # Custom extension slots available for additional fields, in fill order
+    _CUSTOM_FIELD_SLOTS = (
+        ("flexString2", "flexString2Label"),
+        ("flexString3", "flexString3Label"),
+        ("flexString4", "flexString4Label"),
+        ("cs1", "cs1Label"),
+        ("cs2", "cs2Label"),
+        ("cs3", "cs3Label"),
+    )
+    
+    # Event name prefix and the fallback used when no service is known
+    _EVENT_NAMES = {
+        "blocked": ("Blocked access to ", "web service"),
+        "denied": ("Denied access to ", "web service"),
+    }
+    
     def __init__(self, output_dir: Path):
         """Initialize CEF formatter."""
         super().__init__(output_dir)
@@ -27,34 +62,33 @@ class CEFFormatter(LogFormatter):
         self.product = "Web Gateway"
         self.product_version = "8.2.9"
         self.cef_version = "0"  # CEF version is always 0
-        self.current_file = None
-        self.current_date = None
+        # Constant header prefix, escaped once rather than per event
+        self._header_prefix = (
+            f"CEF:{self.cef_version}|{self._escape_header(self.vendor)}|"
+            f"{self._escape_header(self.product)}|"
+            f"{self._escape_header(self.product_version)}|"
+        )
+        self._header_cache: Dict[tuple, str] = {}
     
     def _escape_header(self, value: str) -> str:
         """
         Escape special characters in CEF header fields.
         
-        Header fields need to escape pipe (|) and backslash (\).
+        Header fields need to escape pipe (|) and backslash (\\).
         """
         if not isinstance(value, str):
             value = str(value)
-        value = value.replace('\\', '\\\\')
-        value = value.replace('|', '\\|')
-        return value
+        return value.translate(self._HEADER_TABLE)
     
     def _escape_extension(self, value: str) -> str:
         """
         Escape special characters in CEF extension fields.
         
-        Extension fields need to escape equals (=) and backslash (\).
+        Extension fields need to escape equals (=) and backslash (\\).
         """
         if not isinstance(value, str):
             value = str(value)
-        value = value.replace('\\', '\\\\')
-        value = value.replace('=', '\\=')
-        value = value.replace('\n', '\\n')
-        value = value.replace('\r', '\\r')
-        return value
+        return value.translate(self._EXT_TABLE)
     
     def _get_severity(self, event: LogEvent) -> int:
         """
@@ -66,22 +100,10 @@ class CEFFormatter(LogFormatter):
         - 7-8: High (blocked traffic, security risks)
         - 9-10: Critical (malware, data breach attempts)
         """
-        if event.action == "allowed":
-            if event.risk_level == "low":
-                return 1
-            elif event.risk_level == "medium":
-                return 3
-            else:
-                return 4
-        elif event.action in ["blocked", "denied"]:
-            if event.risk_level == "high":
-                return 8
-            elif event.risk_level == "medium":
-                return 6
-            else:
-                return 5
-        else:
-            return 3
+        severity = self._SEVERITY.get((event.action, event.risk_level))
+        if severity is None:
+            severity = self._DEFAULT_SEVERITY.get(event.action, 3)
+        return severity
     
     def _get_event_class_id(self, event: LogEvent) -> str:
         """
@@ -95,17 +117,12 @@ class CEFFormatter(LogFormatter):
         - 104: DLP violation
         - 105: Shadow IT detected
         """
-        if event.action == "blocked":
+        if event.action in self._REJECTED_ACTIONS:
             return "101"
-        elif event.action == "denied":
-            return "101"
-        elif hasattr(event, 'event_type'):
-            if event.event_type == 'auth':
-                return "102"
-            elif event.event_type == 'malware':
-                return "103"
-            elif event.event_type == 'dlp':
-                return "104"
+        
+        class_id = self._EVENT_TYPE_CLASS_IDS.get(event.event_type)
+        if class_id:
+            return class_id
         elif event.category == "shadow_it":
             return "105"
         else:
@@ -113,12 +130,42 @@ class CEFFormatter(LogFormatter):
     
     def _get_event_name(self, event: LogEvent) -> str:
         """Generate a descriptive name for the event."""
-        if event.action == "blocked":
-            return f"Blocked access to {event.service_name or 'web service'}"
-        elif event.action == "denied":
-            return f"Denied access to {event.service_name or 'web service'}"
-        else:
-            return f"Web request to {event.service_name or 'service'}"
+        prefix, fallback = self._EVENT_NAMES.get(event.action, ("Web request to ", "service"))
+        return prefix + (event.service_name or fallback)
+    
+    def _get_header(self, event: LogEvent) -> str:
+        """
+        Build the CEF header (everything before the extension) for an event.
+        
+        The header only depends on a handful of low-cardinality fields, so
+        each distinct combination is built once and then served from cache.
+        """
+        key = (event.action, event.event_type, event.category, event.risk_level, event.service_name)
+        header = self._header_cache.get(key)
+        if header is None:
+            header = (
+                self._header_prefix
+                + self._get_event_class_id(event) + "|"
+                + self._escape_header(self._get_event_name(event)) + "|"
+                + str(self._get_severity(event))
+            )
+            self._header_cache[key] = header
+        return header
+    
+    def _format_additional_fields(self, additional_fields: Dict[str, Any]) -> str:
+        """
+        Map additional fields onto CEF custom fields.
+        
+        Returns:
+            Extension suffix (with leading space), or an empty string
+        """
+        # flexString1 carries the risk level, leaving flexString2-4 and cs1-3
+        extensions = [
+            f"{value_key}={self._escape_extension(str(value))} {label_key}={key}"
+            for (value_key, label_key), (key, value) in zip(self._CUSTOM_FIELD_SLOTS, additional_fields.items())
+        ]
+        
+        return " " + " ".join(extensions) if extensions else ""
     
     def format_event(self, event: LogEvent) -> str:
         """
@@ -131,136 +178,36 @@ class CEFFormatter(LogFormatter):
             CEF formatted string
         """
         # Build CEF header
-        header_parts = [
-            f"CEF:{self.cef_version}",
-            self._escape_header(self.vendor),
-            self._escape_header(self.product),
-            self._escape_header(self.product_version),
-            self._get_event_class_id(event),
-            self._escape_header(self._get_event_name(event)),
-            str(self._get_severity(event))
-        ]
-        header = "|".join(header_parts)
-        
-        # Build extension fields (key=value pairs)
-        extensions = []
-        
-        # Timestamp
-        extensions.append(f"rt={int(event.timestamp.timestamp() * 1000)}")
-        
-        # Source and destination
-        extensions.append(f"src={event.source_ip}")
-        extensions.append(f"dst={event.destination_ip}")
-        extensions.append(f"spt={event.source_port}")
-        extensions.append(f"dpt={event.destination_port}")
-        
-        # User information
-        extensions.append(f"suser={self._escape_extension(event.username)}")
-        extensions.append(f"sntdom={self._escape_extension(event.user_domain)}")
-        
-        # Request information
-        extensions.append(f"request={self._escape_extension(event.url)}")
-        extensions.append(f"requestMethod={event.method}")
-        extensions.append(f"app={event.protocol.upper()}")
-        
-        # Response
-        extensions.append(f"flexNumber1={event.status_code}")
-        extensions.append(f"flexNumber1Label=HTTPStatus")
-        
-        # Traffic metrics
-        extensions.append(f"in={event.bytes_received}")
-        extensions.append(f"out={event.bytes_sent}")
-        extensions.append(f"cn1={event.duration_ms}")
-        extensions.append(f"cn1Label=ResponseTime")
-        
-        # User agent
-        extensions.append(f"requestClientApplication={self._escape_extension(event.user_agent)}")
-        
-        # Category and action
-        extensions.append(f"cat={self._escape_extension(event.category)}")
-        extensions.append(f"act={event.action}")
-        
-        # Risk level
-        extensions.append(f"flexString1={event.risk_level}")
-        extensions.append(f"flexString1Label=RiskLevel")
-        
-        # Service name
+        header = self._get_header(event)
+        
+        # Build extension fields (key=value pairs) in a single template
+        ext_table = self._EXT_TABLE
+        cef_line = (
+            f"{header}|"
+            f"rt={event.epoch_ms()} "
+            f"src={event.source_ip} dst={event.destination_ip} "
+            f"spt={event.source_port} dpt={event.destination_port} "
+            f"suser={event.username.translate(ext_table)} "
+            f"sntdom={event.user_domain.translate(ext_table)} "
+            f"request={event.url.translate(ext_table)} "
+            f"requestMethod={event.method} app={event.protocol.upper()} "
+            f"flexNumber1={event.status_code} flexNumber1Label=HTTPStatus "
+            f"in={event.bytes_received} out={event.bytes_sent} "
+            f"cn1={event.duration_ms} cn1Label=ResponseTime "
+            f"requestClientApplication={event.user_agent.translate(ext_table)} "
+            f"cat={event.category.translate(ext_table)} act={event.action} "
+            f"flexString1={event.risk_level} flexString1Label=RiskLevel"
+        )
+        
+        # Optional fields are appended only when present
         if event.service_name:
-            extensions.append(f"destinationServiceName={self._escape_extension(event.service_name)}")
+            cef_line += f" destinationServiceName={event.service_name.translate(ext_table)}"
         
-        # Referrer
         if event.referrer:
-            extensions.append(f"requestContext={self._escape_extension(event.referrer)}")
+            cef_line += f" requestContext={event.referrer.translate(ext_table)}"
         
         # Additional fields
         if event.additional_fields:
-            # Map additional fields to CEF custom fields
-            flex_string_index = 2
-            custom_index = 1
-            
-            for key, value in event.additional_fields.items():
-                if flex_string_index <= 4:  # CEF supports flexString1-4
-                    extensions.append(f"flexString{flex_string_index}={self._escape_extension(str(value))}")
-                    extensions.append(f"flexString{flex_string_index}Label={key}")
-                    flex_string_index += 1
-                elif custom_index <= 3:  # Use custom fields cs1-cs6
-                    extensions.append(f"cs{custom_index}={self._escape_extension(str(value))}")
-                    extensions.append(f"cs{custom_index}Label={key}")
-                    custom_index += 1
-        
-        # Combine header and extensions
-        cef_line = header + "|" + " ".join(extensions)
-        
-        return cef_line
-    
-    def write_event(self, event: LogEvent) -> None:
-        """
-        Write a formatted event to the appropriate log file.
-        
-        Log files are organized by date: cef_YYYYMMDD.log
-        """
-        # Determine file name based on event date
-        event_date = event.timestamp.date()
-        
-        # Check if we need to open a new file
-        if self.current_date != event_date or self._file_handle is None:
-            # Close previous file if open
-            if self._file_handle:
-                self._file_handle.close()
-            
-            # Open new file
-            filename = f"cef_{event_date.strftime('%Y%m%d')}.log"
-            filepath = self.output_dir / filename
-            self._file_handle = open(filepath, 'a', encoding='utf-8')
-            self.current_date = event_date
-            self.current_file = filepath
-        
-        # Format and write the event
-        cef_line = self.format_event(event)
-        self._file_handle.write(cef_line + '\n')
-        self._file_handle.flush()  # Ensure data is written
-    
-    def write_batch(self, events: list[LogEvent]) -> None:
-        """
-        Write a batch of events efficiently.
-        
-        Args:
-            events: List of events to write
-        """
-        # Group events by date
-        events_by_date = {}
-        for event in events:
-            event_date = event.timestamp.date()
-            if event_date not in events_by_date:
-                events_by_date[event_date] = []
-            events_by_date[event_date].append(event)
+            cef_line += self._format_additional_fields(event.additional_fields)
         
-        # Write each group
-        for date, date_events in sorted(events_by_date.items()):
-            filename = f"cef_{date.strftime('%Y%m%d')}.log"
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'a', encoding='utf-8') as f:
-                for event in date_events:
-                    cef_line = self.format_event(event)
-                    f.write(cef_line + '\n')
\ No newline at end of file
+        return cef_line
\ No newline at end of file
@@ -21,6 +21,15 @@ class LEEFFormatter(LogFormatter):
     LEEF:Version|Vendor|Product|Version|EventID|key1=value1|key2=value2|...
     """
     
+    _filename_prefix = "leef"
+    
+    # Escape table for single-pass str.translate
+    _ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '|': '\\|', '\n': '\\n', '\r': '\\r'})
+    
+    # Event ID lookups
+    _REJECTED_ACTIONS = frozenset({"blocked", "denied"})
+    _EVENT_TYPE_IDS = {"auth": "2", "malware": "3", "dlp": "4"}
+    
     def __init__(self, output_dir: Path):
         """Initialize LEEF formatter."""
         super().__init__(output_dir)
@@ -28,22 +37,21 @@ class LEEFFormatter(LogFormatter):
         self.product = "Web Gateway"
         self.product_version = "8.2.9"
         self.leef_version = "1.0"
-        self.current_file = None
-        self.current_date = None
+        # Constant header prefix, built once rather than per event
+        self._header_prefix = (
+            f"LEEF:{self.leef_version}|{self.vendor}|{self.product}|"
+            f"{self.product_version}|"
+        )
     
     def _escape_value(self, value: str) -> str:
         """
         Escape special characters in LEEF values.
         
-        LEEF requires escaping of pipe (|) and backslash (\) characters.
+        LEEF requires escaping of pipe (|) and backslash (\\) characters.
         """
         if not isinstance(value, str):
             value = str(value)
-        value = value.replace('\\', '\\\\')
-        value = value.replace('|', '\\|')
-        value = value.replace('\n', '\\n')
-        value = value.replace('\r', '\\r')
-        return value
+        return value.translate(self._ESCAPE_TABLE)
     
     def _get_event_id(self, event: LogEvent) -> str:
         """
@@ -56,14 +64,10 @@ class LEEFFormatter(LogFormatter):
         - 3: Malware detected
         - 4: DLP violation
         """
-        if event.action == "blocked":
-            return "1"
-        elif event.action == "denied":
+        if event.action in self._REJECTED_ACTIONS:
             return "1"
-        elif hasattr(event, 'event_type') and event.event_type == 'auth':
-            return "2"
-        else:
-            return "0"  # Allowed traffic
+        # Anything else that is not a known event type is allowed traffic
+        return self._EVENT_TYPE_IDS.get(event.event_type, "0")
     
     def format_event(self, event: LogEvent) -> str:
         """
@@ -76,113 +80,38 @@ class LEEFFormatter(LogFormatter):
             LEEF formatted string
         """
         # Build LEEF header
-        header = f"LEEF:{self.leef_version}|{self.vendor}|{self.product}|{self.product_version}|{self._get_event_id(event)}"
-        
-        # Convert timestamp to milliseconds since epoch
-        dev_time = int(event.timestamp.timestamp() * 1000)
-        
-        # Build key-value pairs
-        fields = []
-        
-        # Required LEEF fields
-        fields.append(f"devTime={dev_time}")
-        fields.append(f"src={event.source_ip}")
-        fields.append(f"dst={event.destination_ip}")
-        fields.append(f"srcPort={event.source_port}")
-        fields.append(f"dstPort={event.destination_port}")
-        
-        # User information
-        fields.append(f"usrName={self._escape_value(event.username)}")
-        fields.append(f"domain={self._escape_value(event.user_domain)}")
-        
-        # Request information
-        fields.append(f"url={self._escape_value(event.url)}")
-        fields.append(f"method={event.method}")
-        fields.append(f"proto={event.protocol}")
-        fields.append(f"status={event.status_code}")
-        
-        # Traffic information
-        fields.append(f"bytesIn={event.bytes_received}")
-        fields.append(f"bytesOut={event.bytes_sent}")
-        fields.append(f"responseTime={event.duration_ms}")
-        
-        # User agent
-        fields.append(f"userAgent={self._escape_value(event.user_agent)}")
-        
-        # Category and risk
-        fields.append(f"category={self._escape_value(event.category)}")
-        fields.append(f"riskLevel={event.risk_level}")
-        
-        # Action taken
-        fields.append(f"action={event.action}")
-        
-        # Service name if available
+        header = self._header_prefix + self._get_event_id(event)
+        
+        # Build key-value pairs in a single template
+        escape_table = self._ESCAPE_TABLE
+        leef_line = (
+            f"{header}|"
+            f"devTime={event.epoch_ms()}|"
+            f"src={event.source_ip}|dst={event.destination_ip}|"
+            f"srcPort={event.source_port}|dstPort={event.destination_port}|"
+            f"usrName={event.username.translate(escape_table)}|"
+            f"domain={event.user_domain.translate(escape_table)}|"
+            f"url={event.url.translate(escape_table)}|"
+            f"method={event.method}|proto={event.protocol}|status={event.status_code}|"
+            f"bytesIn={event.bytes_received}|bytesOut={event.bytes_sent}|"
+            f"responseTime={event.duration_ms}|"
+            f"userAgent={event.user_agent.translate(escape_table)}|"
+            f"category={event.category.translate(escape_table)}|"
+            f"riskLevel={event.risk_level}|action={event.action}"
+        )
+        
+        # Optional fields are appended only when present
         if event.service_name:
-            fields.append(f"application={self._escape_value(event.service_name)}")
+            leef_line += f"|application={event.service_name.translate(escape_table)}"
         
-        # Referrer if available
         if event.referrer:
-            fields.append(f"referrer={self._escape_value(event.referrer)}")
+            leef_line += f"|referrer={event.referrer.translate(escape_table)}"
         
-        # Additional fields if provided
         if event.additional_fields:
-            for key, value in event.additional_fields.items():
-                # Convert camelCase to LEEF style (camelCase is ok in LEEF)
-                fields.append(f"{key}={self._escape_value(str(value))}")
-        
-        # Combine header and fields
-        leef_line = header + "|" + "|".join(fields)
+            # camelCase keys are valid LEEF attribute names
+            leef_line += "".join(
+                f"|{key}={self._escape_value(str(value))}"
+                for key, value in event.additional_fields.items()
+            )
         
-        return leef_line
-    
-    def write_event(self, event: LogEvent) -> None:
-        """
-        Write a formatted event to the appropriate log file.
-        
-        Log files are organized by date: leef_YYYYMMDD.log
-        """
-        # Determine file name based on event date
-        event_date = event.timestamp.date()
-        
-        # Check if we need to open a new file
-        if self.current_date != event_date or self._file_handle is None:
-            # Close previous file if open
-            if self._file_handle:
-                self._file_handle.close()
-            
-            # Open new file
-            filename = f"leef_{event_date.strftime('%Y%m%d')}.log"
-            filepath = self.output_dir / filename
-            self._file_handle = open(filepath, 'a', encoding='utf-8')
-            self.current_date = event_date
-            self.current_file = filepath
-        
-        # Format and write the event
-        leef_line = self.format_event(event)
-        self._file_handle.write(leef_line + '\n')
-        self._file_handle.flush()  # Ensure data is written
-    
-    def write_batch(self, events: list[LogEvent]) -> None:
-        """
-        Write a batch of events efficiently.
-        
-        Args:
-            events: List of events to write
-        """
-        # Group events by date
-        events_by_date = {}
-        for event in events:
-            event_date = event.timestamp.date()
-            if event_date not in events_by_date:
-                events_by_date[event_date] = []
-            events_by_date[event_date].append(event)
-        
-        # Write each group
-        for date, date_events in sorted(events_by_date.items()):
-            filename = f"leef_{date.strftime('%Y%m%d')}.log"
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'a', encoding='utf-8') as f:
-                for event in date_events:
-                    leef_line = self.format_event(event)
-                    f.write(leef_line + '\n')
\ No newline at end of file
+        return leef_line
\ No newline at end of file
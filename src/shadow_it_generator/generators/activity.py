@@ -6,14 +6,20 @@ and requests based on configured patterns.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from heapq import merge
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Tuple
+from zoneinfo import ZoneInfo
 import logging
 import random
-import uuid
+
+import numpy as np
 
 from ..config.models import EnterpriseConfig, CloudService
 from ..core.user import User
 from ..core.session import Session
+from ..utils.random_cursor import RandomCursor
+from ..utils.rng import numpy_rng
 from ..utils.time_utils import get_activity_multiplier, distribute_events_naturally
 from .junk_traffic import JunkTrafficGenerator
 
@@ -29,6 +35,18 @@ class ActivityGenerator:
     realistic activity patterns.
     """
     
+    _MOBILE_USER_AGENTS = (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) Mobile/15E148",
+        "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 Mobile",
+        "Mozilla/5.0 (iPad; CPU OS 15_0 like Mac OS X) Mobile/15E148"
+    )
+    
+    # Number of session IDs drawn per refill of the ID buffer
+    _SESSION_ID_BATCH = 4096
+    
+    # Buffered uniform draws reserved per active user each hour
+    _SESSION_DRAWS_PER_USER = 8
+    
     def __init__(
         self,
         enterprise_config: EnterpriseConfig,
@@ -52,12 +70,42 @@ class ActivityGenerator:
         
         # Create service lookup
         self.service_map = {service.name: service for service in services}
+        self._service_index = {service.name: i for i, service in enumerate(services)}
+        
+        # User agent pools, split into desktop and mobile once
+        (self._desktop_agents, self._desktop_cum_weights,
+         self._mobile_agents, self._mobile_cum_weights) = self._build_user_agent_pool()
         
-        # User agent pool
-        self.user_agents = self._build_user_agent_pool()
+        # Junk traffic probability per user profile, fixed for the run
+        junk_config = enterprise_config.junk_traffic or {}
+        if junk_config.get('enabled', False):
+            self._junk_probability = junk_config.get('percentage_of_total', 0.0)
+        else:
+            self._junk_probability = 0.0
+        self._junk_probability_by_profile = {
+            'risky': self._junk_probability * 1.5,
+            'normal': self._junk_probability * 0.8
+        }
+        
+        # Enterprise timezone, resolved once for the hourly multiplier
+        self._timezone = ZoneInfo(enterprise_config.enterprise.get('timezone', 'America/New_York'))
+        
+        # Pre-drawn session IDs, consumed from the end
+        self._session_ids: List[str] = []
+        
+        # Generator for the per-hour batched draws, reused across hours
+        self._rng = numpy_rng()
     
-    def _build_user_agent_pool(self) -> List[Tuple[str, float]]:
-        """Build pool of user agents from enterprise config."""
+    def _build_user_agent_pool(
+        self
+    ) -> Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[str, ...], Tuple[float, ...]]:
+        """
+        Build desktop and mobile user agent pools from enterprise config.
+        
+        Returns:
+            Tuple of (desktop agents, desktop cumulative weights,
+            mobile agents, mobile cumulative weights)
+        """
         # Default user agents if not configured
         default_agents = [
             ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0", 0.45),
@@ -67,13 +115,29 @@ class ActivityGenerator:
         ]
         
         # TODO: Parse from enterprise config when available
-        return default_agents
+        desktop = [(ua, weight) for ua, weight in default_agents if 'Mobile' not in ua]
+        mobile = [(ua, weight) for ua, weight in default_agents if 'Mobile' in ua]
+        
+        # Fall back to fixed pools so the getters never need to branch
+        if not desktop:
+            desktop = [("Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0", 1.0)]
+        if not mobile:
+            mobile = [(ua, 1.0) for ua in self._MOBILE_USER_AGENTS]
+        
+        return (
+            tuple(ua for ua, _ in desktop),
+            tuple(accumulate(weight for _, weight in desktop)),
+            tuple(ua for ua, _ in mobile),
+            tuple(accumulate(weight for _, weight in mobile))
+        )
     
     def generate_user_activity(
         self,
         user: User,
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        decisions: Optional[Tuple[bool, bool, np.ndarray]] = None,
+        rand: Optional[RandomCursor] = None
     ) -> List[Session]:
         """
         Generate all activity for a user in a time period.
@@ -82,11 +146,17 @@ class ActivityGenerator:
             user: The user to generate activity for
             start_time: Start of period
             end_time: End of period
+            decisions: Optional pre-drawn (is_mobile, use_vpn, session draws
+                per service) from _draw_hour_decisions; drawn per session
+                when omitted
+            rand: Optional buffered random source for per-session draws
             
         Returns:
             List of sessions
         """
         sessions = []
+        # Sessions per service, each already ordered by start time
+        per_service_sessions = []
         
         # Get activity level for this period
         activity_level = user.get_activity_level(start_time)
@@ -106,17 +176,23 @@ class ActivityGenerator:
             if not service:
                 continue
             
+            # One uniform draw decides the session count for this service
+            if decisions is None:
+                draw = random.random()
+            else:
+                draw = decisions[2][self._service_index[service_name]]
+            
             # Determine number of sessions for this service
             if service.status == "blocked":
                 # Blocked services have fewer, shorter sessions
-                num_sessions = 1 if random.random() < 0.3 else 0
+                num_sessions = 1 if draw < 0.3 else 0
             else:
                 # Normal services
                 base_sessions = 1
                 if user.profile.name == "power_user":
-                    base_sessions = random.randint(1, 3)
+                    base_sessions = 1 + int(draw * 3)  # 1-3
                 elif user.profile.name == "risky":
-                    base_sessions = random.randint(1, 2)
+                    base_sessions = 1 + int(draw * 2)  # 1-2
                 
                 num_sessions = int(base_sessions * activity_level)
             
@@ -128,18 +204,30 @@ class ActivityGenerator:
                 burst_probability=0.3
             )
             
-            # Create sessions
+            # Create sessions (session_times comes back sorted)
+            service_sessions = []
             for session_time in session_times:
-                session = self._create_session(user, service, session_time)
-                sessions.append(session)
+                if decisions is None:
+                    session = self._create_session(user, service, session_time)
+                else:
+                    session = self._create_session(
+                        user, service, session_time,
+                        is_mobile=decisions[0], use_vpn=decisions[1], rand=rand
+                    )
+                service_sessions.append(session)
+            per_service_sessions.append(service_sessions)
         
-        return sorted(sessions, key=lambda s: s.start_time)
+        # Merge the sorted per-service runs instead of re-sorting everything
+        return list(merge(*per_service_sessions, key=lambda s: s.start_time))
     
     def _create_session(
         self,
         user: User,
         service: CloudService,
-        start_time: datetime
+        start_time: datetime,
+        is_mobile: Optional[bool] = None,
+        use_vpn: Optional[bool] = None,
+        rand: Optional[RandomCursor] = None
     ) -> Session:
         """
         Create a session for a user and service.
@@ -148,28 +236,37 @@ class ActivityGenerator:
             user: The user
             service: The cloud service
             start_time: Session start time
+            is_mobile: Pre-drawn device decision; drawn here if None
+            use_vpn: Pre-drawn VPN decision; drawn here if None
+            rand: Buffered random source; the random module if None
             
         Returns:
             Configured session
         """
         # Determine if mobile
-        is_mobile = user.should_use_mobile()
+        if is_mobile is None:
+            is_mobile = user.should_use_mobile()
         
         # Select user agent
+        if rand is None:
+            rand = random
         if is_mobile:
-            user_agent = self._get_mobile_user_agent()
+            user_agent = self._get_mobile_user_agent(rand)
         else:
-            user_agent = self._get_desktop_user_agent()
+            user_agent = self._get_desktop_user_agent(rand)
         
         # Get source IP
-        if random.random() < 0.1:  # 10% VPN usage
+        if use_vpn is None:
+            use_vpn = rand.random() < 0.1  # 10% VPN usage
+        
+        if use_vpn:
             source_ip = self.ip_generator.generate_vpn_ip() or user.source_ip
         else:
             source_ip = user.source_ip
         
         # Create session
         session = Session(
-            id=str(uuid.uuid4()),
+            id=self._next_session_id(),
             user=user,
             service=service,
             start_time=start_time,
@@ -180,24 +277,33 @@ class ActivityGenerator:
         
         return session
     
-    def _get_desktop_user_agent(self) -> str:
-        """Get a desktop user agent string."""
-        agents = [(ua, weight) for ua, weight in self.user_agents if 'Mobile' not in ua]
-        if not agents:
-            return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0"
+    def _next_session_id(self) -> str:
+        """
+        Get a random UUID4-formatted session ID.
         
-        weights = [w for _, w in agents]
-        selected = random.choices([ua for ua, _ in agents], weights=weights)[0]
-        return selected
+        IDs only need to be unique, not unpredictable, so they are cut from
+        one large block of random bytes instead of one uuid4() per session.
+        """
+        try:
+            return self._session_ids.pop()
+        except IndexError:
+            # Empty; refill
+            raw = random.getrandbits(128 * self._SESSION_ID_BATCH).to_bytes(
+                16 * self._SESSION_ID_BATCH, 'little'
+            ).hex()
+            self._session_ids = [
+                f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+                for h in (raw[i:i + 32] for i in range(0, len(raw), 32))
+            ]
+            return self._session_ids.pop()
+    
+    def _get_desktop_user_agent(self, rand: Any = random) -> str:
+        """Get a desktop user agent string."""
+        return rand.choices(self._desktop_agents, cum_weights=self._desktop_cum_weights)[0]
     
-    def _get_mobile_user_agent(self) -> str:
+    def _get_mobile_user_agent(self, rand: Any = random) -> str:
         """Get a mobile user agent string."""
-        mobile_agents = [
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) Mobile/15E148",
-            "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 Mobile",
-            "Mozilla/5.0 (iPad; CPU OS 15_0 like Mac OS X) Mobile/15E148"
-        ]
-        return random.choice(mobile_agents)
+        return rand.choices(self._mobile_agents, cum_weights=self._mobile_cum_weights)[0]
     
     def generate_hourly_activity(
         self,
@@ -218,25 +324,60 @@ class ActivityGenerator:
         user_sessions = {}
         
         # Calculate how many users should be active this hour
-        activity_multiplier = get_activity_multiplier(
-            hour_start,
-            timezone=self.enterprise_config.enterprise.get('timezone', 'America/New_York')
-        )
+        activity_multiplier = get_activity_multiplier(hour_start, timezone=self._timezone)
+        
+        rng = self._rng
         
         # Determine active users
-        num_active = int(len(users) * activity_multiplier * random.uniform(0.8, 1.2))
-        active_users = random.sample(users, min(num_active, len(users)))
+        num_active = int(len(users) * activity_multiplier * rng.uniform(0.8, 1.2))
+        active_idx = rng.choice(len(users), min(num_active, len(users)), replace=False)
+        active_users = [users[i] for i in active_idx.tolist()]
         
         logger.info(f"Generating activity for {len(active_users)} users at {hour_start}")
         
+        # Draw every user's device, VPN and session-count decisions at once
+        is_mobile, use_vpn, session_draws = self._draw_hour_decisions(rng, active_users)
+        
+        # Per-session draws come from one buffered block for the hour
+        rand = RandomCursor(rng, max(1, len(active_users)) * self._SESSION_DRAWS_PER_USER)
+        
         # Generate activity for each active user
-        for user in active_users:
-            sessions = self.generate_user_activity(user, hour_start, hour_end)
+        for i, user in enumerate(active_users):
+            sessions = self.generate_user_activity(
+                user, hour_start, hour_end,
+                decisions=(is_mobile[i], use_vpn[i], session_draws[i]),
+                rand=rand
+            )
             if sessions:
                 user_sessions[user.id] = sessions
         
         return user_sessions
     
+    def _draw_hour_decisions(
+        self,
+        rng: np.random.Generator,
+        users: List[User]
+    ) -> Tuple[List[bool], List[bool], np.ndarray]:
+        """
+        Draw the per-user random decisions for one hour in bulk.
+        
+        Args:
+            rng: Random generator for the hour
+            users: Active users
+            
+        Returns:
+            Tuple of (mobile flag per user, VPN flag per user, array of
+            uniform session-count draws shaped users x services)
+        """
+        n_users = len(users)
+        mobile_probability = np.fromiter((u.mobile_probability for u in users), float, n_users)
+        
+        is_mobile = (rng.random(n_users) < mobile_probability).tolist()
+        use_vpn = (rng.random(n_users) < 0.1).tolist()  # 10% VPN usage
+        session_draws = rng.random((n_users, len(self.services)))
+        
+        return is_mobile, use_vpn, session_draws
+    
     def should_generate_junk_traffic(self, user: User, timestamp: datetime) -> bool:
         """
         Determine if a user should generate junk traffic.
@@ -248,16 +389,6 @@ class ActivityGenerator:
         Returns:
             True if junk traffic should be generated
         """
-        if not self.enterprise_config.junk_traffic or not self.enterprise_config.junk_traffic.enabled:
-            return False
-        
-        # Base probability from config
-        junk_probability = self.enterprise_config.junk_traffic.percentage_of_total
-        
-        # Adjust based on user profile
-        if user.profile.name == "risky":
-            junk_probability *= 1.5
-        elif user.profile.name == "normal":
-            junk_probability *= 0.8
-        
-        return random.random() < junk_probability
\ No newline at end of file
+        return random.random() < self._junk_probability_by_profile.get(
+            user.profile.name, self._junk_probability
+        )
\ No newline at end of file
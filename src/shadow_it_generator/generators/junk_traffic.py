@@ -7,13 +7,183 @@ part of the main cloud services, adding realism to the log data.
 
 import json
 import random
+import re
+import sys
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
 import numpy as np
 
 from ..formatters.base import LogEvent
 from ..utils.ip_generator import IPGenerator
+from ..utils.random_cursor import RandomCursor
+from ..utils.rng import numpy_rng
+
+
+# Slot descriptor backing LogEvent.additional_fields, used by JunkLogEvent
+_ADDITIONAL_FIELDS_SLOT = LogEvent.additional_fields
+
+
+class JunkLogEvent(LogEvent):
+    """
+    Log event for junk traffic.
+    
+    Stores the site category and domain in slots and only builds the
+    additional_fields dict when something reads it, so bulk junk events
+    don't each carry an extra dict from creation.
+    """
+    __slots__ = ('site_category', 'domain')
+    
+    def __init__(self, *args: Any, site_category: str = "", domain: str = "", **kwargs: Any):
+        """
+        Initialize a junk event.
+        
+        Args:
+            site_category: Junk site category (news, shopping, ...)
+            domain: Visited domain
+            *args, **kwargs: Passed through to LogEvent
+        """
+        self.site_category = site_category
+        self.domain = domain
+        LogEvent.__init__(self, *args, **kwargs)
+    
+    @property
+    def additional_fields(self) -> Optional[Dict[str, Any]]:
+        """Extra fields, materialized from the junk slots on first access."""
+        fields = _ADDITIONAL_FIELDS_SLOT.__get__(self)
+        if fields is None:
+            fields = {
+                'junk_traffic': True,
+                'site_category': self.site_category,
+                'domain': self.domain
+            }
+            _ADDITIONAL_FIELDS_SLOT.__set__(self, fields)
+        return fields
+    
+    @additional_fields.setter
+    def additional_fields(self, value: Optional[Dict[str, Any]]) -> None:
+        _ADDITIONAL_FIELDS_SLOT.__set__(self, value)
+
+
+def _utc_offset(dt: datetime) -> Optional[timedelta]:
+    """UTC offset of a datetime, treating naive values as local time."""
+    return dt.utcoffset() if dt.tzinfo is not None else dt.astimezone().utcoffset()
+
+
+# Lookup tables indexed by a boolean draw (False -> common case)
+_DESTINATION_PORTS = (443, 80)
+_METHODS = ('GET', 'POST')
+
+
+# Path templates per junk site category
+_BASE_PATHS = {
+    'news': (
+        '/article/{id}',
+        '/news/{year}/{month}/{id}',
+        '/{category}/{title}',
+        '/story/{id}',
+        '/breaking-news/{id}',
+        '/opinion/{author}/{id}',
+        '/world/{region}/{id}',
+        '/politics/{id}',
+        '/business/{id}',
+        '/technology/{id}'
+    ),
+    'reference': (
+        '/wiki/{topic}',
+        '/article/{topic}',
+        '/how-to/{action}',
+        '/definition/{word}',
+        '/guide/{topic}',
+        '/tutorial/{subject}',
+        '/faq/{category}',
+        '/help/{topic}',
+        '/docs/{section}',
+        '/learn/{subject}'
+    ),
+    'shopping': (
+        '/product/{id}',
+        '/category/{name}',
+        '/search?q={query}',
+        '/deals/{category}',
+        '/sale/{event}',
+        '/item/{sku}',
+        '/browse/{department}',
+        '/brand/{name}',
+        '/checkout/cart',
+        '/wishlist'
+    ),
+    'blogs': (
+        '/post/{id}',
+        '/{year}/{month}/{title}',
+        '/blog/{author}/{title}',
+        '/article/{id}',
+        '/story/{slug}',
+        '/{category}/{post}',
+        '/archives/{year}/{month}',
+        '/tag/{tag}',
+        '/author/{name}',
+        '/feed'
+    ),
+    'forums': (
+        '/thread/{id}',
+        '/topic/{id}',
+        '/post/{id}',
+        '/board/{name}',
+        '/discussion/{id}',
+        '/question/{id}',
+        '/answer/{id}',
+        '/user/{username}',
+        '/search?q={query}',
+        '/trending'
+    ),
+    'misc': (
+        '/',
+        '/forecast/{location}',
+        '/scores/{sport}',
+        '/results/{event}',
+        '/schedule/{team}',
+        '/player/{name}',
+        '/stats/{category}',
+        '/map/{location}',
+        '/directions/{route}',
+        '/restaurant/{id}'
+    )
+}
+
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+# Value generators for path placeholders; called only when a template uses them
+_PLACEHOLDER_GENERATORS = {
+    'id': lambda: str(random.randint(1000, 999999)),
+    'year': lambda: str(random.randint(2020, 2024)),
+    'month': lambda: f"{random.randint(1, 12):02d}",
+    'category': lambda: random.choice(('tech', 'health', 'finance', 'sports', 'entertainment')),
+    'title': lambda: f"article-{random.randint(100, 9999)}",
+    'topic': lambda: random.choice(('python', 'cooking', 'fitness', 'travel', 'history')),
+    'word': lambda: random.choice(('algorithm', 'pandemic', 'inflation', 'climate', 'innovation')),
+    'action': lambda: random.choice(('install', 'configure', 'troubleshoot', 'optimize', 'secure')),
+    'query': lambda: random.choice(('laptop', 'shoes', 'phone', 'book', 'game')),
+    'name': lambda: random.choice(('electronics', 'clothing', 'home', 'sports', 'toys')),
+    'sku': lambda: f"SKU{random.randint(100000, 999999)}",
+    'department': lambda: random.choice(('mens', 'womens', 'kids', 'home', 'garden')),
+    'event': lambda: random.choice(('summer', 'blackfriday', 'clearance', 'flash', 'weekend')),
+    'author': lambda: random.choice(('john-doe', 'jane-smith', 'tech-writer', 'news-team')),
+    'slug': lambda: f"post-{random.randint(100, 9999)}",
+    'tag': lambda: random.choice(('tutorial', 'news', 'review', 'howto', 'update')),
+    'username': lambda: f"user{random.randint(1000, 99999)}",
+    'sport': lambda: random.choice(('nfl', 'nba', 'mlb', 'soccer', 'tennis')),
+    'location': lambda: random.choice(('new-york', 'los-angeles', 'chicago', 'houston', 'phoenix')),
+    'team': lambda: random.choice(('patriots', 'lakers', 'yankees', 'cowboys', 'warriors')),
+    'route': lambda: 'from-here-to-there',
+}
+
+
+def _fill_placeholder(match: 're.Match') -> str:
+    """Replace one {placeholder} match, leaving unknown names untouched."""
+    generator = _PLACEHOLDER_GENERATORS.get(match.group(1))
+    return generator() if generator else match.group(0)
 
 
 class JunkTrafficGenerator:
@@ -24,6 +194,16 @@ class JunkTrafficGenerator:
     traffic to news sites, blogs, forums, shopping sites, etc.
     """
     
+    # Typical response size range (bytes) per category for allowed requests
+    _SIZE_RANGES = {
+        'news': (5000, 50000),
+        'reference': (3000, 30000),
+        'shopping': (10000, 100000),
+        'blogs': (2000, 20000),
+        'forums': (1000, 15000),
+        'misc': (1000, 20000)
+    }
+    
     def __init__(
         self,
         junk_config: Dict[str, Any],
@@ -48,6 +228,38 @@ class JunkTrafficGenerator:
         # Pre-calculate category weights
         self.category_weights = list(self.config['categories'].values())
         self.categories = list(self.config['categories'].keys())
+        # Event category per site category, built and interned once
+        self._category_labels = [sys.intern(f'general_{c}') for c in self.categories]
+        
+        # Cumulative distributions for O(log n) weighted sampling
+        self._category_p = np.array(self.category_weights, dtype=float)
+        self._category_p /= self._category_p.sum()
+        self._category_cdf = np.cumsum(self._category_p)
+        self._category_allowed_rate = np.array(
+            [self.junk_sites[c]['allowed_rate'] for c in self.categories]
+        )
+        self._category_domains = []
+        self._category_site_https = []
+        self._category_site_cdf = []
+        for category in self.categories:
+            sites = self.junk_sites[category]['sites']
+            popularity = np.array([site['popularity'] for site in sites], dtype=float)
+            self._category_domains.append([site['domain'] for site in sites])
+            # Domains listed with a scheme always get port 443
+            self._category_site_https.append(['https://' in site['domain'] for site in sites])
+            self._category_site_cdf.append(np.cumsum(popularity) / popularity.sum())
+        # Plain-list copies for scalar bisect lookups
+        self._category_cdf_list = self._category_cdf.tolist()
+        self._category_site_cdf_lists = [cdf.tolist() for cdf in self._category_site_cdf]
+        size_ranges = [self._SIZE_RANGES.get(c, (1000, 20000)) for c in self.categories]
+        self._category_min_size = np.array([low for low, _ in size_ranges])
+        self._category_max_size = np.array([high for _, high in size_ranges])
+        # Plain-list copies indexed by category for the scalar event path
+        self._category_allowed_rate_list = self._category_allowed_rate.tolist()
+        self._category_size_ranges = size_ranges
+        
+        # Generator for the batched draws, reused across calls
+        self._rng = numpy_rng()
     
     def _load_junk_sites(self) -> Dict[str, Dict[str, Any]]:
         """Load junk sites from data file."""
@@ -58,141 +270,56 @@ class JunkTrafficGenerator:
         
         return data['junk_sites']
     
-    def _select_random_site(self) -> Tuple[str, str]:
+    def _select_random_site(self, rand: Any = random) -> Tuple[str, str, int, int]:
         """
         Select a random site based on category weights.
         
+        Args:
+            rand: Random source (the random module or a RandomCursor)
+        
         Returns:
-            Tuple of (domain, category)
+            Tuple of (domain, category, category index, site index)
         """
-        # Select category
-        category = random.choices(self.categories, weights=self.category_weights)[0]
+        # Select category, then a site within it by popularity
+        ci = min(bisect_right(self._category_cdf_list, rand.random()), len(self.categories) - 1)
+        site_cdf = self._category_site_cdf_lists[ci]
+        si = min(bisect_right(site_cdf, rand.random()), len(site_cdf) - 1)
         
-        # Get sites in category
-        category_data = self.junk_sites[category]
-        sites = category_data['sites']
+        return self._category_domains[ci][si], self.categories[ci], ci, si
+    
+    def _select_random_sites(self, rng: np.random.Generator, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Select n sites at once based on category and popularity weights.
         
-        # Select site based on popularity weights
-        site_weights = [site['popularity'] for site in sites]
-        selected_site = random.choices(sites, weights=site_weights)[0]
+        Args:
+            rng: NumPy random generator to draw from
+            n: Number of sites to select
+            
+        Returns:
+            Tuple of (category indices, site indices within each category)
+        """
+        cat_idx = np.minimum(np.searchsorted(self._category_cdf, rng.random(n), side='right'), len(self.categories) - 1)
+        site_r = rng.random(n)
+        site_idx = np.empty(n, dtype=np.int64)
+        for c, cdf in enumerate(self._category_site_cdf):
+            mask = cat_idx == c
+            site_idx[mask] = np.minimum(np.searchsorted(cdf, site_r[mask], side='right'), len(cdf) - 1)
         
-        return selected_site['domain'], category
+        return cat_idx, site_idx
     
     def _generate_random_path(self, domain: str, category: str) -> str:
         """Generate a random but plausible path for the domain."""
-        base_paths = {
-            'news': [
-                '/article/{id}',
-                '/news/{year}/{month}/{id}',
-                '/{category}/{title}',
-                '/story/{id}',
-                '/breaking-news/{id}',
-                '/opinion/{author}/{id}',
-                '/world/{region}/{id}',
-                '/politics/{id}',
-                '/business/{id}',
-                '/technology/{id}'
-            ],
-            'reference': [
-                '/wiki/{topic}',
-                '/article/{topic}',
-                '/how-to/{action}',
-                '/definition/{word}',
-                '/guide/{topic}',
-                '/tutorial/{subject}',
-                '/faq/{category}',
-                '/help/{topic}',
-                '/docs/{section}',
-                '/learn/{subject}'
-            ],
-            'shopping': [
-                '/product/{id}',
-                '/category/{name}',
-                '/search?q={query}',
-                '/deals/{category}',
-                '/sale/{event}',
-                '/item/{sku}',
-                '/browse/{department}',
-                '/brand/{name}',
-                '/checkout/cart',
-                '/wishlist'
-            ],
-            'blogs': [
-                '/post/{id}',
-                '/{year}/{month}/{title}',
-                '/blog/{author}/{title}',
-                '/article/{id}',
-                '/story/{slug}',
-                '/{category}/{post}',
-                '/archives/{year}/{month}',
-                '/tag/{tag}',
-                '/author/{name}',
-                '/feed'
-            ],
-            'forums': [
-                '/thread/{id}',
-                '/topic/{id}',
-                '/post/{id}',
-                '/board/{name}',
-                '/discussion/{id}',
-                '/question/{id}',
-                '/answer/{id}',
-                '/user/{username}',
-                '/search?q={query}',
-                '/trending'
-            ],
-            'misc': [
-                '/',
-                '/forecast/{location}',
-                '/scores/{sport}',
-                '/results/{event}',
-                '/schedule/{team}',
-                '/player/{name}',
-                '/stats/{category}',
-                '/map/{location}',
-                '/directions/{route}',
-                '/restaurant/{id}'
-            ]
-        }
-        
         # Get paths for category
-        paths = base_paths.get(category, ['/'])
-        path_template = random.choice(paths)
-        
-        # Replace placeholders
-        replacements = {
-            '{id}': str(random.randint(1000, 999999)),
-            '{year}': str(random.randint(2020, 2024)),
-            '{month}': f"{random.randint(1, 12):02d}",
-            '{category}': random.choice(['tech', 'health', 'finance', 'sports', 'entertainment']),
-            '{title}': f"article-{random.randint(100, 9999)}",
-            '{topic}': random.choice(['python', 'cooking', 'fitness', 'travel', 'history']),
-            '{word}': random.choice(['algorithm', 'pandemic', 'inflation', 'climate', 'innovation']),
-            '{action}': random.choice(['install', 'configure', 'troubleshoot', 'optimize', 'secure']),
-            '{query}': random.choice(['laptop', 'shoes', 'phone', 'book', 'game']),
-            '{name}': random.choice(['electronics', 'clothing', 'home', 'sports', 'toys']),
-            '{sku}': f"SKU{random.randint(100000, 999999)}",
-            '{department}': random.choice(['mens', 'womens', 'kids', 'home', 'garden']),
-            '{event}': random.choice(['summer', 'blackfriday', 'clearance', 'flash', 'weekend']),
-            '{author}': random.choice(['john-doe', 'jane-smith', 'tech-writer', 'news-team']),
-            '{slug}': f"post-{random.randint(100, 9999)}",
-            '{tag}': random.choice(['tutorial', 'news', 'review', 'howto', 'update']),
-            '{username}': f"user{random.randint(1000, 99999)}",
-            '{sport}': random.choice(['nfl', 'nba', 'mlb', 'soccer', 'tennis']),
-            '{location}': random.choice(['new-york', 'los-angeles', 'chicago', 'houston', 'phoenix']),
-            '{team}': random.choice(['patriots', 'lakers', 'yankees', 'cowboys', 'warriors']),
-            '{route}': 'from-here-to-there'
-        }
+        path_template = random.choice(_BASE_PATHS.get(category, ('/',)))
+        if '{' not in path_template:
+            return path_template
         
-        for placeholder, value in replacements.items():
-            path_template = path_template.replace(placeholder, value)
-        
-        return path_template
+        # Only draw values for the placeholders the template actually uses
+        return _PLACEHOLDER_RE.sub(_fill_placeholder, path_template)
     
-    def _determine_action(self, category: str) -> str:
+    def _determine_action(self, category_index: int, rand: Any = random) -> str:
         """Determine if the request is allowed or blocked based on category."""
-        category_data = self.junk_sites[category]
-        if random.random() < category_data['allowed_rate']:
+        if rand.random() < self._category_allowed_rate_list[category_index]:
             return 'allowed'
         else:
             return 'blocked'
@@ -202,7 +329,8 @@ class JunkTrafficGenerator:
         user_email: str,
         source_ip: str,
         timestamp: datetime,
-        user_agent: str
+        user_agent: str,
+        rand: Optional[RandomCursor] = None
     ) -> LogEvent:
         """
         Generate a single junk traffic event.
@@ -212,41 +340,42 @@ class JunkTrafficGenerator:
             source_ip: Source IP address
             timestamp: Event timestamp
             user_agent: User agent string
+            rand: Buffered random source for the per-event draws; the
+                random module is used if None
             
         Returns:
             LogEvent for junk traffic
         """
+        if rand is None:
+            rand = random
+        
         # Select random site
-        domain, category = self._select_random_site()
+        domain, category, category_index, site_index = self._select_random_site(rand)
         
         # Generate path
         path = self._generate_random_path(domain, category)
         
         # Determine action based on category
-        action = self._determine_action(category)
+        action = self._determine_action(category_index, rand)
         
         # Generate realistic response sizes
         if action == 'allowed':
             # Different categories have different typical sizes
-            size_ranges = {
-                'news': (5000, 50000),
-                'reference': (3000, 30000),
-                'shopping': (10000, 100000),
-                'blogs': (2000, 20000),
-                'forums': (1000, 15000),
-                'misc': (1000, 20000)
-            }
-            min_size, max_size = size_ranges.get(category, (1000, 20000))
-            bytes_received = random.randint(min_size, max_size)
-            bytes_sent = random.randint(300, 2000)
-            status_code = random.choices([200, 304], weights=[0.8, 0.2])[0]
-            duration_ms = random.randint(50, 500)
+            min_size, max_size = self._category_size_ranges[category_index]
+            bytes_received = rand.randint(min_size, max_size)
+            bytes_sent = rand.randint(300, 2000)
+            status_code = 200 if rand.random() < 0.8 else 304
+            duration_ms = rand.randint(50, 500)
         else:
             # Blocked requests
             bytes_received = 0
-            bytes_sent = random.randint(100, 500)
+            bytes_sent = rand.randint(100, 500)
             status_code = 403
-            duration_ms = random.randint(10, 50)
+            duration_ms = rand.randint(10, 50)
+        
+        # One draw decides port, method and referrer: its six decimal digits
+        # are split into three independent uniform values in [0, 100)
+        packed = int(rand.random() * 1_000_000)
         
         # Determine risk level based on category and action
         if action == 'blocked':
@@ -254,37 +383,76 @@ class JunkTrafficGenerator:
             category_name = 'blocked_content'
         else:
             risk_level = 'low'
-            category_name = f'general_{category}'
+            category_name = self._category_labels[category_index]
         
         # Create log event
-        return LogEvent(
+        return JunkLogEvent(
             timestamp=timestamp,
             source_ip=source_ip,
             destination_ip=self.ip_generator.generate_destination_ip(),
             source_port=self.ip_generator.generate_source_port(),
-            destination_port=443 if 'https://' in domain or random.random() > 0.1 else 80,
+            destination_port=(
+                443 if self._category_site_https[category_index][site_index]
+                else _DESTINATION_PORTS[packed % 100 < 10]
+            ),
             username=user_email.split('@')[0],
             user_domain=self.enterprise_domain,
             url=f"https://{domain}{path}",
-            method='GET' if random.random() > 0.1 else 'POST',
+            method=_METHODS[packed // 100 % 100 < 10],
             status_code=status_code,
             bytes_sent=bytes_sent,
             bytes_received=bytes_received,
             duration_ms=duration_ms,
             user_agent=user_agent,
-            referrer=f"https://{domain}/" if random.random() > 0.5 else None,
+            referrer=f"https://{domain}/" if packed // 10000 >= 50 else None,
             action=action,
             category=category_name,
             risk_level=risk_level,
             service_name=f"Internet-{category}",
             protocol='https' if status_code != 403 else 'https',
-            additional_fields={
-                'junk_traffic': True,
-                'site_category': category,
-                'domain': domain
-            }
+            site_category=category,
+            domain=domain
         )
     
+    # Column order of _sample_event_numbers results as consumed per event
+    _EVENT_NUMBER_KEYS = (
+        'allowed', 'bytes_received', 'bytes_sent', 'status_code',
+        'duration_ms', 'use_https', 'use_get', 'with_referrer'
+    )
+    
+    def _sample_event_numbers(self, rng: np.random.Generator, cat_idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Sample all numeric fields for a batch of junk events.
+        
+        Mirrors the per-event draws in generate_junk_event, with each field
+        drawn once for the whole batch. Ranges that depend on the outcome
+        are selected per element, so every field costs a single draw.
+        
+        Args:
+            rng: NumPy random generator to draw from
+            cat_idx: Category index of each event
+            
+        Returns:
+            Mapping of field name to array, one entry per event
+        """
+        n = len(cat_idx)
+        allowed = rng.random(n) < self._category_allowed_rate[cat_idx]
+        
+        return {
+            'allowed': allowed,
+            'bytes_received': np.where(
+                allowed,
+                rng.integers(self._category_min_size[cat_idx], self._category_max_size[cat_idx] + 1),
+                0
+            ),
+            'bytes_sent': rng.integers(np.where(allowed, 300, 100), np.where(allowed, 2001, 501)),
+            'status_code': np.where(allowed, np.where(rng.random(n) < 0.8, 200, 304), 403),
+            'duration_ms': rng.integers(np.where(allowed, 50, 10), np.where(allowed, 501, 51)),
+            'use_https': rng.random(n) > 0.1,
+            'use_get': rng.random(n) > 0.1,
+            'with_referrer': rng.random(n) > 0.5,
+        }
+    
     def calculate_junk_events_count(self, total_events: int) -> int:
         """
         Calculate how many junk events to generate based on configuration.
@@ -329,19 +497,65 @@ class JunkTrafficGenerator:
         events_per_hour = max(1, int(np.random.normal(mean_per_day / 24, std_per_day / 24)))
         total_events = int(events_per_hour * duration_hours)
         
-        # Generate events spread across the time period
-        for _ in range(total_events):
-            # Random timestamp within the period
-            time_offset = random.uniform(0, (end_time - start_time).total_seconds())
-            event_time = start_time + datetime.timedelta(seconds=time_offset)
+        if total_events <= 0:
+            return events
+        
+        # Draw every random quantity for the batch up front
+        rng = self._rng
+        n = total_events
+        
+        # Sorted offsets yield events already in timestamp order; kept in
+        # whole microseconds, the resolution timedelta would round them to
+        offsets = np.sort(rng.uniform(0, (end_time - start_time).total_seconds(), n))
+        offsets_us = np.rint(offsets * 1e6).astype(np.int64)
+        
+        # Epoch milliseconds for the whole batch, so LogEvent doesn't convert
+        # each timestamp itself. Only valid if the UTC offset is the same at
+        # both ends of the window (no DST change inside it).
+        if _utc_offset(start_time) == _utc_offset(end_time):
+            start_us = int(start_time.replace(microsecond=0).timestamp()) * 1_000_000 + start_time.microsecond
+            timestamps_ms = ((start_us + offsets_us) // 1000).tolist()
+        else:
+            timestamps_ms = [None] * n
+        
+        cat_idx, site_idx = self._select_random_sites(rng, n)
+        
+        nums = self._sample_event_numbers(rng, cat_idx)
+        
+        username = user_email.split('@')[0]
+        columns = zip(
+            offsets_us.tolist(), timestamps_ms, cat_idx.tolist(), site_idx.tolist(),
+            *(nums[key].tolist() for key in self._EVENT_NUMBER_KEYS)
+        )
+        for (offset_us, timestamp_ms, c, site, is_allowed, received, sent, status_code,
+             duration_ms, https, get, referrer) in columns:
+            category = self.categories[c]
+            domain = self._category_domains[c][site]
             
-            # Generate event
-            event = self.generate_junk_event(
-                user_email=user_email,
+            events.append(JunkLogEvent(
+                timestamp=start_time + timedelta(microseconds=offset_us),
                 source_ip=source_ip,
-                timestamp=event_time,
-                user_agent=user_agent
-            )
-            events.append(event)
+                destination_ip=self.ip_generator.generate_destination_ip(),
+                source_port=self.ip_generator.generate_source_port(),
+                destination_port=443 if https or self._category_site_https[c][site] else 80,
+                username=username,
+                user_domain=self.enterprise_domain,
+                url=f"https://{domain}{self._generate_random_path(domain, category)}",
+                method='GET' if get else 'POST',
+                status_code=status_code,
+                bytes_sent=sent,
+                bytes_received=received,
+                duration_ms=duration_ms,
+                user_agent=user_agent,
+                referrer=f"https://{domain}/" if referrer else None,
+                action='allowed' if is_allowed else 'blocked',
+                category=self._category_labels[c] if is_allowed else 'blocked_content',
+                risk_level='low' if is_allowed else 'medium',
+                service_name=f"Internet-{category}",
+                protocol='https',
+                site_category=category,
+                domain=domain,
+                timestamp_ms=timestamp_ms
+            ))
         
-        return sorted(events, key=lambda e: e.timestamp)
\ No newline at end of file
+        return events
\ No newline at end of file
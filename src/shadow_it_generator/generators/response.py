@@ -4,10 +4,48 @@ This module handles generation of realistic HTTP responses including
 status codes, response sizes, and file types.
 """
 
-import random
-from typing import Dict, Tuple, Optional
+import math
+from bisect import bisect
+from itertools import accumulate
+from random import randint as _randint, random as _random, uniform as _uniform
+from typing import Dict, List, Sequence, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
+from ..utils.rng import numpy_rng
+
+
+# Spread of the log-normal response size distribution (in log space)
+_SIZE_SIGMA = 0.5
+
+
+def _draw_truncated_lognormal(rng: np.random.Generator,
+                              mean: float,
+                              min_size: int,
+                              max_size: int,
+                              n: int) -> np.ndarray:
+    """Draw n log-normal sizes truncated to [min_size, max_size].
+    
+    Args:
+        rng: NumPy generator to draw from
+        mean: Mean of the underlying normal (log space)
+        min_size: Smallest size kept
+        max_size: Largest size kept
+        n: Number of sizes to return
+        
+    Returns:
+        Integer array of n sizes
+    """
+    # Ranges are centred on the log-normal's median, so at least ~90% of
+    # draws fall inside and rejection needs few extra rounds
+    kept = np.empty(0, dtype=np.int64)
+    while len(kept) < n:
+        draws = rng.lognormal(mean, _SIZE_SIGMA, n + n // 4)
+        draws = draws[(draws >= min_size) & (draws <= max_size)]
+        kept = np.concatenate((kept, draws.astype(np.int64)))
+    return kept[:n]
+
 
 class FileType(Enum):
     """Common file types for web requests."""
@@ -27,6 +65,54 @@ class FileType(Enum):
     NONE = ""
 
 
+# Content type string per file type, avoiding Enum.value lookups per event
+_FILE_TYPE_VALUES = {file_type: file_type.value for file_type in FileType}
+
+
+# Response size ranges (bytes) by file type
+_SIZE_RANGES = {
+    FileType.HTML: (5_000, 150_000),
+    FileType.JSON: (1_000, 500_000),
+    FileType.XML: (1_000, 100_000),
+    FileType.JS: (1_000, 500_000),
+    FileType.CSS: (1_000, 100_000),
+    FileType.IMAGE_JPEG: (20_000, 2_000_000),
+    FileType.IMAGE_PNG: (10_000, 1_000_000),
+    FileType.IMAGE_GIF: (5_000, 500_000),
+    FileType.PDF: (50_000, 10_000_000),
+    FileType.DOCX: (20_000, 5_000_000),
+    FileType.XLSX: (10_000, 5_000_000),
+    FileType.ZIP: (1_000, 50_000_000),
+    FileType.BINARY: (1_000, 10_000_000),
+}
+
+# API endpoints return smaller JSON bodies than JSON files
+_API_JSON_SIZE_RANGE = (100, 50_000)
+
+# Range for file types without an entry above
+_DEFAULT_SIZE_RANGE = (1_000, 100_000)
+
+# Block reason text and code by service category
+_BLOCK_REASONS = {
+    'File Sharing': ("Unsanctioned File Sharing", 1001),
+    'Personal Storage': ("Personal Cloud Storage Blocked", 1002),
+    'Social Media': ("Social Media Access Denied", 1003),
+    'Personal Email': ("Personal Email Blocked", 1004),
+    'VPN': ("VPN Service Blocked", 1005),
+    'Proxy': ("Anonymous Proxy Blocked", 1006),
+    'Torrent': ("P2P/Torrent Site Blocked", 1007),
+    'Cryptocurrency': ("Cryptocurrency Site Blocked", 1008),
+    'Gambling': ("Gambling Site Blocked", 1009),
+    'Adult Content': ("Adult Content Blocked", 1010),
+    'Unknown': ("Uncategorized Site Blocked", 1099),
+}
+
+_DEFAULT_BLOCK_REASON = ("Policy Violation", 1000)
+
+# Processing time per response size bucket as (minimum ms, number of values)
+_PROCESSING_RANGES = ((5, 16), (20, 31), (50, 151))
+
+
 class ResponseGenerator:
     """Generates realistic HTTP responses.
     
@@ -34,6 +120,9 @@ class ResponseGenerator:
     based on the request context and service configuration.
     """
     
+    # Number of response sizes drawn per refill
+    _SIZE_BUFFER_SIZE = 1024
+    
     def __init__(self):
         """Initialize the response generator."""
         # Status code probabilities for allowed requests
@@ -47,6 +136,19 @@ class ResponseGenerator:
             404: 0.01,  # Not Found
         }
         
+        # Per-method status code CDFs, built once from the weights above
+        self._status_cdfs = self._build_status_cdfs()
+        
+        # Truncated log-normal parameters per file type
+        self._size_params, self._api_json_size_params, self._default_size_params = \
+            self._build_size_params()
+        
+        # Pre-drawn sizes per parameter set, consumed from the end
+        self._size_buffers: Dict[Tuple[int, int, float], List[int]] = {}
+        
+        # Generator for the batched draws, reused across calls
+        self._rng = numpy_rng()
+        
         # File type detection patterns
         self.file_extensions = {
             '.html': FileType.HTML,
@@ -64,6 +166,8 @@ class ResponseGenerator:
             '.xlsx': FileType.XLSX,
             '.zip': FileType.ZIP,
         }
+        self._ext_tuple = tuple(self.file_extensions)
+        self._api_markers = ('/api/', '/v1/', '/v2/')
     
     def generate_response(self,
                          method: str,
@@ -85,9 +189,9 @@ class ResponseGenerator:
             # Blocked request
             return {
                 'status_code': 403,
-                'file_type': FileType.HTML.value,
-                'response_size': random.randint(1000, 5000),
-                'response_time': random.randint(10, 50)
+                'file_type': _FILE_TYPE_VALUES[FileType.HTML],
+                'response_size': _randint(1000, 5000),
+                'response_time': _randint(10, 50)
             }
         
         # Generate status code
@@ -106,11 +210,87 @@ class ResponseGenerator:
         
         return {
             'status_code': status_code,
-            'file_type': file_type.value if file_type != FileType.NONE else '',
+            'file_type': _FILE_TYPE_VALUES[file_type],
             'response_size': response_size,
             'response_time': response_time
         }
     
+    def generate_responses(self,
+                          methods: Sequence[str],
+                          urls: Sequence[str],
+                          is_allowed: Sequence[bool],
+                          is_api: Optional[Sequence[bool]] = None
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Generate HTTP response details for a batch of requests.
+        
+        Vectorized counterpart of generate_response: status codes, sizes
+        and times are sampled with NumPy for the whole batch, grouped by
+        method and size parameters, instead of one request at a time.
+        
+        Args:
+            methods: HTTP method per request
+            urls: Request URL per request
+            is_allowed: Whether each request is allowed
+            is_api: Whether each request is an API call (default: none are)
+            
+        Returns:
+            Tuple of (status codes, file types, response sizes, response
+            times) arrays, one entry per request
+        """
+        n = len(methods)
+        rng = self._rng
+        methods_arr = np.asarray(methods, dtype=object)
+        allowed = np.asarray(is_allowed, dtype=bool)
+        api = np.zeros(n, dtype=bool) if is_api is None else np.asarray(is_api, dtype=bool)
+        
+        # Status codes: one searchsorted per method over its CDF
+        status_codes = np.full(n, 403, dtype=np.int64)
+        for method in set(methods):
+            idx = np.flatnonzero((methods_arr == method) & allowed)
+            if not len(idx):
+                continue
+            codes, cum_weights, total, hi = self._status_cdfs.get(method, self._status_cdfs['default'])
+            picks = np.searchsorted(cum_weights, rng.random(len(idx)) * total, side='right')
+            status_codes[idx] = np.asarray(codes)[np.minimum(picks, hi)]
+        
+        # File types need per-URL string parsing; blocked pages are HTML
+        detected = [
+            self._detect_file_type(url, a) if ok else FileType.HTML
+            for url, ok, a in zip(urls, allowed.tolist(), api.tolist())
+        ]
+        file_types = np.array([_FILE_TYPE_VALUES[file_type] for file_type in detected], dtype=object)
+        
+        # Sizes: empty for HEAD and 204, small for errors and blocks,
+        # truncated log-normal per parameter set otherwise
+        sizes = np.zeros(n, dtype=np.int64)
+        blocked = ~allowed
+        sizes[blocked] = rng.integers(1000, 5001, int(blocked.sum()))
+        has_body = allowed & (methods_arr != 'HEAD') & (status_codes != 204)
+        errors = has_body & (status_codes >= 400)
+        sizes[errors] = rng.integers(200, 2001, int(errors.sum()))
+        sampled = has_body & (status_codes < 400)
+        groups: Dict[Tuple[int, int, float], List[int]] = {}
+        for i in np.flatnonzero(sampled).tolist():
+            file_type = detected[i]
+            if api[i] and file_type is FileType.JSON:
+                params = self._api_json_size_params
+            else:
+                params = self._size_params.get(file_type, self._default_size_params)
+            groups.setdefault(params, []).append(i)
+        for (min_size, max_size, mean), idx in groups.items():
+            sizes[idx] = _draw_truncated_lognormal(rng, mean, min_size, max_size, len(idx))
+        
+        # Times: base latency + processing bucket + transfer time, with variance
+        bucket = (sizes >= 10_000).astype(np.intp) + (sizes >= 100_000)
+        low = np.array([r[0] for r in _PROCESSING_RANGES])[bucket]
+        count = np.array([r[1] for r in _PROCESSING_RANGES])[bucket]
+        processing = low + (rng.random(n) * count).astype(np.int64)
+        total_ms = rng.integers(20, 101, n) + sizes * 8 / 10_000 + processing
+        times = np.maximum(1, (total_ms * rng.uniform(0.8, 1.2, n)).astype(np.int64))
+        times[blocked] = rng.integers(10, 51, int(blocked.sum()))
+        
+        return status_codes, file_types, sizes, times
+    
     def _generate_status_code(self, method: str) -> int:
         """Generate appropriate status code.
         
@@ -120,28 +300,33 @@ class ResponseGenerator:
         Returns:
             HTTP status code
         """
+        codes, cum_weights, total, hi = self._status_cdfs.get(method, self._status_cdfs['default'])
+        # Same selection as random.choices(codes, cum_weights=...), without
+        # its argument handling and list allocation; the hi bound keeps a
+        # draw that rounds up to the total on the last code
+        return codes[bisect(cum_weights, _random() * total, 0, hi)]
+    
+    def _build_status_cdfs(self) -> Dict[str, Tuple[Tuple[int, ...], Tuple[float, ...], float, int]]:
+        """Build status code cumulative weights per HTTP method.
+        
+        Returns:
+            Mapping of method (or 'default') to (codes, cumulative weights,
+            total weight, index of the last code)
+        """
         # Adjust weights based on method
-        weights = self.allowed_status_weights.copy()
-        
-        if method == 'POST':
-            weights[201] = 0.10  # More likely to return Created
-            weights[200] = 0.85
-        elif method == 'DELETE':
-            weights[204] = 0.20  # More likely to return No Content
-            weights[200] = 0.75
-        elif method == 'HEAD':
-            weights[200] = 0.95
-            weights[404] = 0.05
-        
-        # Select status code
-        codes = list(weights.keys())
-        probabilities = list(weights.values())
-        
-        # Normalize probabilities
-        total = sum(probabilities)
-        probabilities = [p/total for p in probabilities]
-        
-        return random.choices(codes, weights=probabilities)[0]
+        overrides = {
+            'POST': {201: 0.10, 200: 0.85},  # More likely to return Created
+            'DELETE': {204: 0.20, 200: 0.75},  # More likely to return No Content
+            'HEAD': {200: 0.95, 404: 0.05},
+            'default': {}
+        }
+        
+        cdfs = {}
+        for method, override in overrides.items():
+            weights = {**self.allowed_status_weights, **override}
+            cum_weights = tuple(accumulate(weights.values()))
+            cdfs[method] = (tuple(weights), cum_weights, cum_weights[-1], len(cum_weights) - 1)
+        return cdfs
     
     def _detect_file_type(self, url: str, is_api: bool) -> FileType:
         """Detect file type from URL.
@@ -160,12 +345,13 @@ class ResponseGenerator:
         # Check URL path for file extension
         path = url.split('?')[0].lower()
         
-        for ext, file_type in self.file_extensions.items():
-            if path.endswith(ext):
-                return file_type
+        # One C-level suffix test; extensions contain a single dot, so the
+        # matching one starts at the last dot in the path
+        if path.endswith(self._ext_tuple):
+            return self.file_extensions[path[path.rfind('.'):]]
         
         # Default based on path patterns
-        if '/api/' in path or '/v1/' in path or '/v2/' in path:
+        if any(marker in path for marker in self._api_markers):
             return FileType.JSON
         elif path.endswith('/') or not '.' in path.split('/')[-1]:
             return FileType.HTML
@@ -194,35 +380,46 @@ class ResponseGenerator:
         
         if status_code >= 400:
             # Error responses are typically small
-            return random.randint(200, 2000)
-        
-        # Size ranges by file type
-        size_ranges = {
-            FileType.HTML: (5_000, 150_000),
-            FileType.JSON: (100, 50_000) if is_api else (1_000, 500_000),
-            FileType.XML: (1_000, 100_000),
-            FileType.JS: (1_000, 500_000),
-            FileType.CSS: (1_000, 100_000),
-            FileType.IMAGE_JPEG: (20_000, 2_000_000),
-            FileType.IMAGE_PNG: (10_000, 1_000_000),
-            FileType.IMAGE_GIF: (5_000, 500_000),
-            FileType.PDF: (50_000, 10_000_000),
-            FileType.DOCX: (20_000, 5_000_000),
-            FileType.XLSX: (10_000, 5_000_000),
-            FileType.ZIP: (1_000, 50_000_000),
-            FileType.BINARY: (1_000, 10_000_000),
-        }
+            return _randint(200, 2000)
         
-        min_size, max_size = size_ranges.get(file_type, (1_000, 100_000))
+        if is_api and file_type is FileType.JSON:
+            params = self._api_json_size_params
+        else:
+            params = self._size_params.get(file_type, self._default_size_params)
         
-        # Use log-normal distribution for more realistic sizes
-        import math
-        mean = math.log((min_size + max_size) / 2)
-        sigma = 0.5
-        size = int(random.lognormvariate(mean, sigma))
+        # Sizes come from a log-normal truncated to the type's range, drawn
+        # by NumPy in blocks rather than one Python-level sample per call
+        buffer = self._size_buffers.get(params)
+        if not buffer:
+            buffer = self._size_buffers[params] = self._draw_sizes(params)
+        return buffer.pop()
+    
+    def _draw_sizes(self, params: Tuple[int, int, float]) -> List[int]:
+        """Draw a block of response sizes for one parameter set."""
+        min_size, max_size, mean = params
+        return _draw_truncated_lognormal(
+            self._rng, mean, min_size, max_size, self._SIZE_BUFFER_SIZE
+        ).tolist()
+    
+    def _build_size_params(self) -> Tuple[Dict[FileType, Tuple[int, int, float]],
+                                          Tuple[int, int, float],
+                                          Tuple[int, int, float]]:
+        """Precompute truncated log-normal size parameters.
+        
+        Returns:
+            Tuple of (parameters per file type, parameters for API JSON,
+            default parameters). Each entry is (min size, max size, log
+            mean).
+        """
+        def params(min_size: int, max_size: int) -> Tuple[int, int, float]:
+            # Log-normal centred on the midpoint of the range
+            return (min_size, max_size, math.log((min_size + max_size) / 2))
         
-        # Clamp to range
-        return max(min_size, min(size, max_size))
+        return (
+            {file_type: params(*bounds) for file_type, bounds in _SIZE_RANGES.items()},
+            params(*_API_JSON_SIZE_RANGE),
+            params(*_DEFAULT_SIZE_RANGE)
+        )
     
     def _generate_response_time(self, response_size: int) -> int:
         """Generate response time based on size and other factors.
@@ -233,25 +430,24 @@ class ResponseGenerator:
         Returns:
             Response time in milliseconds
         """
-        # Base latency
-        base_latency = random.randint(20, 100)
+        # Processing time range by size bucket (<10KB, <100KB, larger)
+        low, count = _PROCESSING_RANGES[(response_size >= 10_000) + (response_size >= 100_000)]
+        
+        # One draw covers both integers: the whole part picks the base
+        # latency (20-100 ms) and the fractional part, still uniform, picks
+        # the processing time
+        r = _random() * 81
+        base_latency = 20 + int(r)
+        processing = low + int((r - int(r)) * count)
         
         # Size-based component (assume 10 Mbps connection)
         size_ms = (response_size * 8) / (10 * 1000)  # Convert to milliseconds
         
-        # Processing time (varies by size)
-        if response_size < 10_000:
-            processing = random.randint(5, 20)
-        elif response_size < 100_000:
-            processing = random.randint(20, 50)
-        else:
-            processing = random.randint(50, 200)
-        
         # Total time with some randomness
         total = base_latency + size_ms + processing
         
         # Add random variance
-        variance = random.uniform(0.8, 1.2)
+        variance = _uniform(0.8, 1.2)
         
         return max(1, int(total * variance))
     
@@ -264,18 +460,4 @@ class ResponseGenerator:
         Returns:
             Tuple of (reason_text, reason_code)
         """
-        block_reasons = {
-            'File Sharing': ("Unsanctioned File Sharing", 1001),
-            'Personal Storage': ("Personal Cloud Storage Blocked", 1002),
-            'Social Media': ("Social Media Access Denied", 1003),
-            'Personal Email': ("Personal Email Blocked", 1004),
-            'VPN': ("VPN Service Blocked", 1005),
-            'Proxy': ("Anonymous Proxy Blocked", 1006),
-            'Torrent': ("P2P/Torrent Site Blocked", 1007),
-            'Cryptocurrency': ("Cryptocurrency Site Blocked", 1008),
-            'Gambling': ("Gambling Site Blocked", 1009),
-            'Adult Content': ("Adult Content Blocked", 1010),
-            'Unknown': ("Uncategorized Site Blocked", 1099),
-        }
-        
-        return block_reasons.get(category, ("Policy Violation", 1000))
\ No newline at end of file
+        return _BLOCK_REASONS.get(category, _DEFAULT_BLOCK_REASON)
\ No newline at end of file
@@ -5,13 +5,17 @@ This module defines patterns for generating realistic network traffic
 based on service characteristics and user behavior.
 """
 
-from dataclasses import dataclass
+from dataclasses import field, replace
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import random
 import numpy as np
 
+from ..utils.compat import slotted_dataclass
+from ..utils.rng import numpy_rng
 
-@dataclass
+
+@slotted_dataclass
 class TrafficPattern:
     """
     Defines traffic patterns for a specific type of activity.
@@ -25,17 +29,42 @@ class TrafficPattern:
     size_std_dev_percent: float = 0.3
     burst_probability: float = 0.2
     
+    # Pre-drawn sizes, handed out one per call and refilled in blocks
+    _req_buf: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _resp_buf: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _req_idx: int = field(default=0, init=False, repr=False, compare=False)
+    _resp_idx: int = field(default=0, init=False, repr=False, compare=False)
+    # Created on the first refill, since patterns are built at import time
+    _rng: Optional[np.random.Generator] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Number of sizes drawn per refill
+    _BUFFER_SIZE = 1024
+    
     def generate_request_size(self) -> int:
         """Generate a request size based on the pattern."""
-        std_dev = self.avg_request_size * self.size_std_dev_percent
-        size = int(np.random.normal(self.avg_request_size, std_dev))
-        return max(100, size)  # Minimum 100 bytes
+        if self._req_idx == len(self._req_buf):
+            self._req_buf = self._draw_sizes(self.avg_request_size)
+            self._req_idx = 0
+        size = self._req_buf[self._req_idx]
+        self._req_idx += 1
+        return size
     
     def generate_response_size(self) -> int:
         """Generate a response size based on the pattern."""
-        std_dev = self.avg_response_size * self.size_std_dev_percent
-        size = int(np.random.normal(self.avg_response_size, std_dev))
-        return max(100, size)  # Minimum 100 bytes
+        if self._resp_idx == len(self._resp_buf):
+            self._resp_buf = self._draw_sizes(self.avg_response_size)
+            self._resp_idx = 0
+        size = self._resp_buf[self._resp_idx]
+        self._resp_idx += 1
+        return size
+    
+    def _draw_sizes(self, mean: int) -> List[int]:
+        """Draw a block of normally distributed sizes around a mean."""
+        std_dev = mean * self.size_std_dev_percent
+        if self._rng is None:
+            self._rng = numpy_rng()
+        sizes = self._rng.normal(mean, std_dev, self._BUFFER_SIZE).astype(np.int64)
+        return np.maximum(sizes, 100).tolist()  # Minimum 100 bytes
     
     def should_burst(self) -> bool:
         """Determine if this should be a burst of activity."""
@@ -51,9 +80,32 @@ class TrafficPatternLibrary:
     Library of common traffic patterns for different activities.
     """
     
+    # Traffic pattern name per service category
+    _CATEGORY_PATTERNS = {
+        'cloud_storage': 'file_transfer',
+        'collaboration': 'chat',
+        'productivity': 'api_heavy',
+        'development': 'api_heavy',
+        'social_media': 'web_browsing',
+        'email': 'chat',
+        'streaming': 'streaming',
+        'file_transfer': 'file_transfer',
+        'communication': 'chat',
+        'analytics': 'api_heavy',
+        'ai_ml': 'api_heavy'
+    }
+    
     @staticmethod
     def get_patterns() -> Dict[str, TrafficPattern]:
         """Get predefined traffic patterns."""
+        # Fresh copies (with empty size buffers) so callers can't alter
+        # the shared table or its patterns
+        return {name: replace(pattern) for name, pattern in TrafficPatternLibrary._shared_patterns().items()}
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _shared_patterns() -> Dict[str, TrafficPattern]:
+        """Build the predefined patterns once; only copies are handed out."""
         return {
             'web_browsing': TrafficPattern(
                 name='web_browsing',
@@ -103,20 +155,6 @@ class TrafficPatternLibrary:
     @staticmethod
     def get_pattern_for_category(category: str) -> TrafficPattern:
         """Get appropriate pattern for a service category."""
-        category_patterns = {
-            'cloud_storage': 'file_transfer',
-            'collaboration': 'chat',
-            'productivity': 'api_heavy',
-            'development': 'api_heavy',
-            'social_media': 'web_browsing',
-            'email': 'chat',
-            'streaming': 'streaming',
-            'file_transfer': 'file_transfer',
-            'communication': 'chat',
-            'analytics': 'api_heavy',
-            'ai_ml': 'api_heavy'
-        }
-        
-        pattern_name = category_patterns.get(category, 'web_browsing')
-        patterns = TrafficPatternLibrary.get_patterns()
-        return patterns.get(pattern_name, patterns['web_browsing'])
\ No newline at end of file
+        pattern_name = TrafficPatternLibrary._CATEGORY_PATTERNS.get(category, 'web_browsing')
+        patterns = TrafficPatternLibrary._shared_patterns()
+        return replace(patterns.get(pattern_name, patterns['web_browsing']))
\ No newline at end of file
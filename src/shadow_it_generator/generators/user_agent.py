@@ -5,11 +5,26 @@ for simulating different browsers and devices.
 """
 
 import random
-from typing import List, Dict
-from dataclasses import dataclass
+import re
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, Iterable, List, Dict
 
+from ..utils.compat import slotted_dataclass
 
-@dataclass
+
+# Version patterns like "91.0.4472.124"
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+def _increment_version(match: re.Match, step: int) -> str:
+    """Rebuild a matched version string with its third part increased by step."""
+    parts = [int(x) for x in match.groups()]
+    parts[2] += step
+    return '.'.join(str(x) for x in parts)
+
+
+@slotted_dataclass
 class UserAgentConfig:
     """Configuration for a user agent."""
     user_agent: str
@@ -26,7 +41,7 @@ class UserAgentGenerator:
     to users based on configured weights and patterns.
     """
     
-    def __init__(self, browser_configs: List[Dict[str, any]]):
+    def __init__(self, browser_configs: List[Dict[str, Any]]):
         """Initialize the user agent generator.
         
         Args:
@@ -45,10 +60,14 @@ class UserAgentGenerator:
         for config in self.configs:
             config.weight = config.weight / self.total_weight
         
+        # Cumulative weights for O(log n) selection
+        self._configs_tuple = tuple(self.configs)
+        self._cum_weights = tuple(accumulate(config.weight for config in self.configs))
+        
         # User assignments for consistency
         self.user_assignments = {}
     
-    def _parse_user_agent(self, config: Dict[str, any]) -> UserAgentConfig:
+    def _parse_user_agent(self, config: Dict[str, Any]) -> UserAgentConfig:
         """Parse user agent string to extract browser and OS info.
         
         Args:
@@ -104,13 +123,15 @@ class UserAgentGenerator:
         Returns:
             User agent string
         """
-        # Check if user already has an assignment
-        if user_id and user_id in self.user_assignments:
+        # Users are normally pre-assigned, making this a single lookup
+        try:
             return self.user_assignments[user_id]
+        except KeyError:
+            pass
         
         # Select based on weights
-        weights = [config.weight for config in self.configs]
-        selected = random.choices(self.configs, weights=weights)[0]
+        index = bisect(self._cum_weights, random.random() * self._cum_weights[-1])
+        selected = self._configs_tuple[min(index, len(self._configs_tuple) - 1)]
         
         # Store assignment if user_id provided
         if user_id:
@@ -118,6 +139,20 @@ class UserAgentGenerator:
         
         return selected.user_agent
     
+    def assign_users(self, user_ids: Iterable[str]) -> None:
+        """Assign user agents to a user population in one batch.
+        
+        Users that already have an assignment keep it.
+        
+        Args:
+            user_ids: IDs of the users to assign
+        """
+        new_ids = [uid for uid in dict.fromkeys(user_ids) if uid and uid not in self.user_assignments]
+        selected = random.choices(self._configs_tuple, cum_weights=self._cum_weights, k=len(new_ids))
+        
+        for uid, config in zip(new_ids, selected):
+            self.user_assignments[uid] = config.user_agent
+    
     def get_mobile_user_agents(self) -> List[str]:
         """Get all mobile user agents.
         
@@ -146,19 +181,8 @@ class UserAgentGenerator:
         
         # Simple version number variations
         for i in range(1, count):
-            # Find version numbers and increment them
-            import re
-            
-            # Match version patterns like "91.0.4472.124"
-            pattern = r'(\d+)\.(\d+)\.(\d+)\.(\d+)'
-            
-            def increment_version(match):
-                parts = [int(x) for x in match.groups()]
-                # Increment minor version
-                parts[2] += i
-                return '.'.join(str(x) for x in parts)
-            
-            varied_ua = re.sub(pattern, increment_version, base_ua, count=1)
+            # Find version numbers and increment the minor version
+            varied_ua = _VERSION_RE.sub(lambda m, i=i: _increment_version(m, i), base_ua, count=1)
             if varied_ua != base_ua:
                 variations.append(varied_ua)
         
@@ -5,14 +5,18 @@ This module simulates different user behaviors including work patterns,
 break times, and service usage habits.
 """
 
+from bisect import bisect_right, insort
 from datetime import datetime, time, timedelta
+from itertools import accumulate
 from typing import List, Dict, Any, Tuple, Optional
-import random
+from random import random as _random, uniform as _uniform
 import numpy as np
-from dataclasses import dataclass
 
+from ..utils.compat import slotted_dataclass
+from ..utils.rng import numpy_rng
 
-@dataclass
+
+@slotted_dataclass
 class UserBehaviorProfile:
     """Defines behavior characteristics for a user type."""
     name: str
@@ -22,8 +26,38 @@ class UserBehaviorProfile:
     work_duration_std: float
     break_frequency: int    # Breaks per day
     break_duration: float   # Minutes
-    focus_periods: List[Tuple[float, float]]  # High activity periods (start, end)
+    focus_periods: np.ndarray  # High activity periods, float32 rows of (start, end)
     multitasking_factor: float  # 0-1, likelihood of using multiple services
+    
+    def __post_init__(self):
+        """Store focus periods as a compact (K, 2) float32 array."""
+        self.focus_periods = np.asarray(self.focus_periods, dtype=np.float32).reshape(-1, 2)
+
+
+def _interval_index(intervals: List[Tuple[float, float]]) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Build a lookup for point-in-intervals checks.
+    
+    Args:
+        intervals: (start, end) pairs, possibly overlapping
+        
+    Returns:
+        Tuple of (sorted starts, running maximum of the ends in that order)
+    """
+    ordered = sorted(intervals)
+    return (
+        tuple(start for start, _ in ordered),
+        tuple(accumulate((end for _, end in ordered), max))
+    )
+
+
+def _in_intervals(index: Tuple[Tuple[float, ...], Tuple[float, ...]], point: float) -> bool:
+    """Check whether a point lies in any interval of an _interval_index lookup."""
+    starts, max_ends = index
+    # Every interval up to i starts at or before the point; one of them
+    # covers it exactly when the largest end among them reaches it
+    i = bisect_right(starts, point) - 1
+    return i >= 0 and max_ends[i] >= point
 
 
 class UserBehaviorSimulator:
@@ -33,6 +67,9 @@ class UserBehaviorSimulator:
     Handles work schedules, break times, and activity variations.
     """
     
+    # Number of (start hour, duration) pairs drawn per refill
+    _SCHEDULE_BUFFER_SIZE = 1024
+    
     def __init__(self):
         """Initialize behavior profiles."""
         self.profiles = {
@@ -70,6 +107,21 @@ class UserBehaviorSimulator:
                 multitasking_factor=0.7
             )
         }
+        
+        # Pre-drawn (start hours, durations) per profile, consumed from the end
+        self._schedule_draws: Dict[str, Tuple[List[float], List[float]]] = {}
+        
+        # Pre-drawn break offsets per profile, one row per schedule
+        self._break_draws: Dict[str, List[List[float]]] = {}
+        
+        # Generator for the batched draws, reused across refills
+        self._rng = numpy_rng()
+        
+        # Focus period lookups per profile
+        self._focus_index = {
+            name: _interval_index(profile.focus_periods.tolist())
+            for name, profile in self.profiles.items()
+        }
     
     def generate_work_schedule(self, profile_name: str, date: datetime) -> Dict[str, Any]:
         """
@@ -86,7 +138,7 @@ class UserBehaviorSimulator:
         
         # Skip weekends with some probability
         if date.weekday() >= 5:  # Saturday or Sunday
-            if random.random() > 0.1:  # 10% chance of weekend work
+            if _random() > 0.1:  # 10% chance of weekend work
                 return {
                     'is_working': False,
                     'work_start': None,
@@ -94,13 +146,8 @@ class UserBehaviorSimulator:
                     'breaks': []
                 }
         
-        # Generate work start time
-        start_hour = np.random.normal(profile.work_start_mean, profile.work_start_std)
-        start_hour = max(5.0, min(12.0, start_hour))  # Clamp between 5 AM and noon
-        
-        # Generate work duration
-        duration = np.random.normal(profile.work_duration_mean, profile.work_duration_std)
-        duration = max(4.0, min(14.0, duration))  # Clamp between 4 and 14 hours
+        # Generate work start time and duration
+        start_hour, duration = self._next_schedule_draw(profile)
         
         # Convert to times
         start_time = time(int(start_hour), int((start_hour % 1) * 60))
@@ -115,9 +162,66 @@ class UserBehaviorSimulator:
             'work_start': start_time,
             'work_end': end_time,
             'breaks': breaks,
+            'break_index': _interval_index(breaks),
             'focus_periods': profile.focus_periods
         }
     
+    def generate_work_schedules_batch(
+        self,
+        profile_name: str,
+        n: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw work start hours and durations for many schedules at once.
+        
+        Args:
+            profile_name: User profile type
+            n: Number of schedules
+            
+        Returns:
+            Tuple of (start hours, durations in hours) arrays
+        """
+        profile = self.profiles.get(profile_name, self.profiles['normal'])
+        rng = self._rng
+        
+        start_hours = rng.normal(profile.work_start_mean, profile.work_start_std, n)
+        start_hours = np.clip(start_hours, 5.0, 12.0)  # Clamp between 5 AM and noon
+        
+        durations = rng.normal(profile.work_duration_mean, profile.work_duration_std, n)
+        durations = np.clip(durations, 4.0, 14.0)  # Clamp between 4 and 14 hours
+        
+        return start_hours, durations
+    
+    def _next_schedule_draw(self, profile: UserBehaviorProfile) -> Tuple[float, float]:
+        """Take one (start hour, duration) pair, refilling the buffer in bulk."""
+        draws = self._schedule_draws.get(profile.name)
+        if not draws or not draws[0]:
+            start_hours, durations = self.generate_work_schedules_batch(
+                profile.name, self._SCHEDULE_BUFFER_SIZE
+            )
+            draws = (start_hours.tolist(), durations.tolist())
+            self._schedule_draws[profile.name] = draws
+        return draws[0].pop(), draws[1].pop()
+    
+    def _next_break_draw(self, profile: UserBehaviorProfile) -> List[float]:
+        """
+        Take one schedule's break offsets, refilling the buffer in bulk.
+        
+        Returns:
+            Row of [lunch start offset, lunch minutes, jitter per other break]
+        """
+        rows = self._break_draws.get(profile.name)
+        if not rows:
+            n = self._SCHEDULE_BUFFER_SIZE
+            rng = self._rng
+            rows = np.column_stack((
+                rng.uniform(-0.5, 0.5, n),
+                rng.uniform(30, 60, n),
+                rng.uniform(-0.5, 0.5, (n, max(0, profile.break_frequency - 1)))
+            )).tolist()
+            self._break_draws[profile.name] = rows
+        return rows.pop()
+    
     def _generate_breaks(
         self, 
         start_hour: float, 
@@ -127,25 +231,29 @@ class UserBehaviorSimulator:
         """Generate break times during work hours."""
         breaks = []
         work_duration = end_hour - start_hour
-        
-        # Always include lunch break around noon
-        if start_hour < 12 and end_hour > 13:
-            lunch_start = 12 + random.uniform(-0.5, 0.5)
-            lunch_duration = random.uniform(30, 60) / 60  # 30-60 minutes
-            breaks.append((lunch_start, lunch_start + lunch_duration))
+        lunch_offset, lunch_minutes, *jitters = self._next_break_draw(profile)
         
         # Add other breaks
-        remaining_breaks = profile.break_frequency - 1
-        if remaining_breaks > 0 and work_duration > 4:
+        if jitters and work_duration > 4:
             # Distribute breaks throughout the day
-            break_interval = work_duration / (remaining_breaks + 1)
-            for i in range(remaining_breaks):
-                break_time = start_hour + (i + 1) * break_interval + random.uniform(-0.5, 0.5)
+            break_interval = work_duration / (len(jitters) + 1)
+            duration = profile.break_duration / 60  # Convert to hours
+            for i, jitter in enumerate(jitters, 1):
+                break_time = start_hour + i * break_interval + jitter
                 if break_time < end_hour - 1:
-                    duration = profile.break_duration / 60  # Convert to hours
                     breaks.append((break_time, break_time + duration))
+            # Jitter is within +/-0.5h, so breaks come out in order unless
+            # they are spaced less than an hour apart
+            if break_interval < 1:
+                breaks.sort()
         
-        return sorted(breaks)
+        # Always include lunch break around noon
+        if start_hour < 12 and end_hour > 13:
+            lunch_start = 12 + lunch_offset
+            lunch_duration = lunch_minutes / 60  # 30-60 minutes
+            insort(breaks, (lunch_start, lunch_start + lunch_duration))
+        
+        return breaks
     
     def get_activity_level(
         self, 
@@ -177,29 +285,22 @@ class UserBehaviorSimulator:
             return 0.0
         
         # Check if on break
-        for break_start, break_end in schedule['breaks']:
-            if break_start <= hour <= break_end:
-                return 0.2  # Reduced activity during breaks
-        
-        # Base activity level
-        activity = 0.7
+        break_index = schedule.get('break_index') or _interval_index(schedule['breaks'])
+        if _in_intervals(break_index, hour):
+            return 0.2  # Reduced activity during breaks
         
-        # Boost during focus periods
-        profile = self.profiles[profile_name]
-        for focus_start, focus_end in profile.focus_periods:
-            if focus_start <= hour <= focus_end:
-                activity = 1.0
-                break
+        # Base activity level, boosted during focus periods
+        activity = 1.0 if _in_intervals(self._focus_index[profile_name], hour) else 0.7
         
         # Add some randomness
-        activity += random.uniform(-0.1, 0.1)
+        activity += _uniform(-0.1, 0.1)
         
         return max(0.0, min(1.0, activity))
     
     def should_multitask(self, profile_name: str) -> bool:
         """Determine if user should use multiple services simultaneously."""
         profile = self.profiles.get(profile_name, self.profiles['normal'])
-        return random.random() < profile.multitasking_factor
+        return _random() < profile.multitasking_factor
     
     def get_session_intensity(self, profile_name: str, service_category: str) -> float:
         """
@@ -213,7 +314,7 @@ class UserBehaviorSimulator:
         if profile_name == 'power_user':
             base_intensity *= 1.5
         elif profile_name == 'risky':
-            base_intensity *= random.uniform(0.5, 2.0)  # More variable
+            base_intensity *= _uniform(0.5, 2.0)  # More variable
         
         # Category adjustments
         intensity_map = {
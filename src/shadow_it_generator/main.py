@@ -10,10 +10,6 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from .core.engine import LogGenerationEngine
-from .config.parser import ConfigParser
-from .utils.logger import setup_logging
-
 
 @click.command()
 @click.option(
@@ -70,6 +66,11 @@ def main(
     This tool generates logs based on enterprise configuration and cloud service
     definitions to simulate realistic shadow IT activity patterns.
     """
+    # The generation stack is imported only once a run is requested, so
+    # --help and shell completion do not pay for it
+    from .core.engine import LogGenerationEngine
+    from .config.parser import ConfigParser
+    from .utils.logger import setup_logging
     
     # Setup logging
     setup_logging(verbose)
@@ -1,15 +1,48 @@
 """Data models for Shadow IT Generator."""
 
-from .config import EnterpriseConfig
-from .cloud_service import CloudService
-from .user import User
-from .session import Session
-from .log_entry import LogEntry
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import EnterpriseConfig
+    from .cloud_service import CloudService
+    from .user import User
+    from .session import Session
+    from .log_entry import LogEntry, Action, Result
+
+# Submodule defining each export; loaded on first attribute access (PEP 562)
+# so importing one model does not import the others, or yaml via config
+_EXPORTS = {
+    "EnterpriseConfig": ".config",
+    "CloudService": ".cloud_service",
+    "User": ".user",
+    "Session": ".session",
+    "LogEntry": ".log_entry",
+    "Action": ".log_entry",
+    "Result": ".log_entry",
+}
 
 __all__ = [
     "EnterpriseConfig",
     "CloudService", 
     "User",
     "Session",
-    "LogEntry"
-]
\ No newline at end of file
+    "LogEntry",
+    "Action",
+    "Result"
+]
+
+
+def __getattr__(name: str):
+    """Import an exported model from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List loaded names plus the lazily exported models."""
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,50 +1,65 @@
 """Cloud service model."""
 
-from typing import Dict, Any, List, Optional
+import sys
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Session duration range (seconds) by service category
+_DURATION_RANGES = {
+    "communication": (300, 7200),  # 5 min to 2 hours
+    "collaboration": (300, 7200),
+    "storage": (180, 3600),  # 3 min to 1 hour
+    "productivity": (180, 3600),
+}
+
+_DEFAULT_DURATION_RANGE = (60, 1800)  # 1 min to 30 min
+
+# Top-level sections of a service definition held as attributes
+_SERVICE_SECTIONS = ("service", "network", "traffic_patterns", "activity", "security_events")
 
 
 class CloudService:
-    """Cloud service configuration."""
+    """Cloud service configuration.
+    
+    Commonly read fields are resolved from the config sections once at
+    construction and stored as plain attributes, since they are read per
+    request and per log entry.
+    """
+    
+    __slots__ = (
+        "service", "network", "traffic_patterns", "activity", "security_events", "extra",
+        "name", "status", "category", "risk_level", "domains", "user_adoption_rate",
+        "block_rate", "primary_domain", "duration_range",
+    )
     
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
+        # The loaded dict is not kept; data rebuilds it on demand
         self.service = data.get("service", {})
         self.network = data.get("network", {})
         self.traffic_patterns = data.get("traffic_patterns", {})
         self.activity = data.get("activity", {})
         self.security_events = data.get("security_events", {})
+        # Any other top-level keys, as loaded
+        self.extra = {key: value for key, value in data.items() if key not in _SERVICE_SECTIONS}
+        
+        self.name: str = self.service.get("name", "unknown")
+        self.status: str = self.service.get("status", "unsanctioned")
+        # Copied into every log event; interned so events share one string
+        self.category: str = sys.intern(self.service.get("category", "other"))
+        self.risk_level: str = self.service.get("risk_level", "low")
+        self.domains: List[str] = self.network.get("domains", [])
+        self.user_adoption_rate: float = self.activity.get("user_adoption_rate", 0.1)
+        self.block_rate: float = self.security_events.get("block_rate", 0.0)
+        
+        # Destination used for log entries
+        self.primary_domain: str = self.domains[0] if self.domains else "unknown.com"
+        
+        # Session duration bounds in seconds
+        self.duration_range: Tuple[int, int] = _DURATION_RANGES.get(self.category, _DEFAULT_DURATION_RANGE)
     
     @property
-    def name(self) -> str:
-        """Get service name."""
-        return self.service.get("name", "unknown")
-    
-    @property
-    def status(self) -> str:
-        """Get service status."""
-        return self.service.get("status", "unsanctioned")
-    
-    @property
-    def category(self) -> str:
-        """Get service category."""
-        return self.service.get("category", "other")
-    
-    @property
-    def risk_level(self) -> str:
-        """Get service risk level."""
-        return self.service.get("risk_level", "low")
-    
-    @property
-    def domains(self) -> List[str]:
-        """Get service domains."""
-        return self.network.get("domains", [])
-    
-    @property
-    def user_adoption_rate(self) -> float:
-        """Get user adoption rate."""
-        return self.activity.get("user_adoption_rate", 0.1)
-    
-    @property
-    def block_rate(self) -> float:
-        """Get block rate."""
-        return self.security_events.get("block_rate", 0.0)
\ No newline at end of file
+    def data(self) -> Dict[str, Any]:
+        """Full definition: the known sections plus any other top-level keys."""
+        data = {section: getattr(self, section) for section in _SERVICE_SECTIONS}
+        data.update(self.extra)
+        return data
\ No newline at end of file
@@ -1,36 +1,88 @@
 """Log entry model."""
 
 from datetime import datetime
-from typing import Dict, Any, Optional
+from enum import IntEnum
+from typing import Dict, Any, Optional, Union
+
+
+class Action(IntEnum):
+    """Request action, stored as a small integer id."""
+    BROWSE = 0
+    DOWNLOAD = 1
+    UPLOAD = 2
+    API_CALL = 3
+
+
+class Result(IntEnum):
+    """Request result, stored as a small integer id."""
+    ALLOWED = 0
+    BLOCKED = 1
+
+
+# Shared string tables, indexed by id; names are resolved only on output
+ACTION_NAMES = ("browse", "download", "upload", "api_call")
+RESULT_NAMES = ("allowed", "blocked")
+
+_ACTION_IDS = {name: i for i, name in enumerate(ACTION_NAMES)}
+_RESULT_IDS = {name: i for i, name in enumerate(RESULT_NAMES)}
+
+
+def format_timestamp(timestamp: Union[int, datetime]) -> str:
+    """Render a datetime, or epoch seconds as naive local time, in ISO format."""
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+    # Naive local, the same frame as the naive datetimes the epoch came from
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def format_session_id(session_id: int) -> str:
+    """Render a packed session id as fixed-width hex for log output."""
+    return f"{session_id:020x}"
 
 
 class LogEntry:
     """Represents a single log entry."""
     
-    def __init__(self, timestamp: datetime, user: Any, service: Any, 
-                 action: str, result: str, bytes_transferred: int = 0,
-                 session_id: Optional[str] = None):
+    __slots__ = (
+        "timestamp", "user", "service", "action_id", "result_id", "bytes_transferred",
+        "session_id", "source_ip", "destination",
+    )
+    
+    def __init__(self, timestamp: Union[int, datetime], user: Any, service: Any, 
+                 action: Union[int, str], result: Union[int, str], bytes_transferred: int = 0,
+                 session_id: Optional[int] = None):
         self.timestamp = timestamp
         self.user = user
         self.service = service
-        self.action = action
-        self.result = result
+        # Names are accepted for compatibility and interned to their ids
+        self.action_id = _ACTION_IDS[action] if isinstance(action, str) else int(action)
+        self.result_id = _RESULT_IDS[result] if isinstance(result, str) else int(result)
         self.bytes_transferred = bytes_transferred
         self.session_id = session_id
         self.source_ip = user.ip_address
-        self.destination = service.domains[0] if service.domains else "unknown.com"
+        self.destination = service.primary_domain
+    
+    @property
+    def action(self) -> str:
+        """Action name."""
+        return ACTION_NAMES[self.action_id]
+    
+    @property
+    def result(self) -> str:
+        """Result name."""
+        return RESULT_NAMES[self.result_id]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": format_timestamp(self.timestamp),
             "user": self.user.email,
             "source_ip": self.source_ip,
             "destination": self.destination,
             "service": self.service.name,
             "category": self.service.category,
-            "action": self.action,
-            "result": self.result,
+            "action": ACTION_NAMES[self.action_id],
+            "result": RESULT_NAMES[self.result_id],
             "bytes": self.bytes_transferred,
-            "session_id": self.session_id
+            "session_id": None if self.session_id is None else format_session_id(self.session_id)
         }
\ No newline at end of file
@@ -1,51 +1,102 @@
 """Session model."""
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import random
 
+import numpy as np
+
+from ..utils.rng import numpy_rng
+from .log_entry import ACTION_NAMES
+
+
+def _draw_session_requests(rng: np.random.Generator,
+                           duration: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw a session's request offsets, action ids and sizes as int arrays.
+    
+    Args:
+        rng: NumPy generator to draw from
+        duration: Session length in seconds
+        
+    Returns:
+        Tuple of (offsets in seconds from the session start, action ids,
+        sizes in bytes) for the requests that fall within the session
+    """
+    num_requests = int(rng.integers(5, 51))
+    offsets = np.cumsum(rng.integers(1, 31, num_requests))
+    action_ids = rng.integers(0, len(ACTION_NAMES), num_requests)
+    sizes = rng.integers(1000, 1_000_001, num_requests)
+    
+    # Random time between requests; offsets only grow, so the requests
+    # that end within the session are a prefix
+    kept = int(np.searchsorted(offsets, duration, side='right'))
+    return offsets[:kept], action_ids[:kept], sizes[:kept]
+
 
 class Session:
     """Represents a user session with a service."""
     
-    def __init__(self, user: Any, service: Any, start_time: datetime):
+    __slots__ = (
+        "user", "service", "start_time", "session_id", "duration", "requests",
+    )
+    
+    def __init__(self, user: Any, service: Any, start_time: datetime, service_id: int):
+        """Initialize a session.
+        
+        Args:
+            user: User the session belongs to
+            service: Service being used
+            start_time: Session start
+            service_id: Small integer id of the service, as assigned in
+                ServiceManager.service_ids
+        """
         self.user = user
         self.service = service
         self.start_time = start_time
-        self.session_id = f"{user.id}-{service.name}-{int(start_time.timestamp())}"
+        # Packed as user id (bits 56+), service id (bits 40-55) and the start
+        # timestamp (bits 0-39, good until year 36812); formatted only when logged
+        self.session_id = (
+            (int(user.id) << 56)
+            | ((service_id & 0xFFFF) << 40)
+            | int(start_time.timestamp())
+        )
         self.duration = self._calculate_duration()
-        self.end_time = start_time + timedelta(seconds=self.duration)
         self.requests: List[Dict[str, Any]] = []
     
+    @property
+    def end_time(self) -> datetime:
+        """Time the session ends."""
+        return self.start_time + timedelta(seconds=self.duration)
+    
     def _calculate_duration(self) -> int:
         """Calculate session duration in seconds."""
-        # Simple duration logic based on service category
-        if self.service.category in ["communication", "collaboration"]:
-            return random.randint(300, 7200)  # 5 min to 2 hours
-        elif self.service.category in ["storage", "productivity"]:
-            return random.randint(180, 3600)  # 3 min to 1 hour
-        else:
-            return random.randint(60, 1800)  # 1 min to 30 min
+        # Range depends on the service category and is resolved at load time
+        low, high = self.service.duration_range
+        return random.randint(low, high)
     
-    def generate_requests(self) -> List[Dict[str, Any]]:
-        """Generate requests for the session."""
-        num_requests = random.randint(5, 50)
-        current_time = self.start_time
+    def generate_requests(self, rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+        """Generate requests for the session.
+        
+        Args:
+            rng: Generator to draw from; callers generating many sessions
+                should create one with numpy_rng() and pass it to each
+                (default: a new one from numpy_rng())
+        """
+        if rng is None:
+            rng = numpy_rng()
+        offsets, action_ids, sizes = _draw_session_requests(rng, self.duration)
         
-        for _ in range(num_requests):
-            # Random time between requests
-            current_time += timedelta(seconds=random.randint(1, 30))
-            if current_time > self.end_time:
-                break
-            
-            request = {
-                "timestamp": current_time,
+        # Offsets are whole seconds from the start, kept in its own frame
+        start_time = self.start_time
+        for offset, action_id, size in zip(offsets.tolist(), action_ids.tolist(), sizes.tolist()):
+            self.requests.append({
+                "timestamp": start_time + timedelta(seconds=offset),
                 "user": self.user,
                 "service": self.service,
                 "session_id": self.session_id,
-                "action": random.choice(["browse", "download", "upload", "api_call"]),
-                "bytes": random.randint(1000, 1000000)
-            }
-            self.requests.append(request)
+                "action_id": action_id,
+                "action": ACTION_NAMES[action_id],
+                "bytes": size
+            })
         
         return self.requests
\ No newline at end of file
@@ -1,21 +1,49 @@
 """User model."""
 
-from typing import List, Set, Dict, Any
+from typing import List, Set, Dict, Any, Sequence, Union
 import random
 
 
+# Adoption rate multiplier by service status
+_STATUS_ADOPTION_FACTORS = {"sanctioned": 1.2, "blocked": 0.1}
+
+
 class User:
     """Represents an enterprise user."""
     
-    def __init__(self, user_id: int, domain: str, profile: Dict[str, Any]):
+    __slots__ = (
+        "id", "domain", "profiles", "profile_id", "username", "email", "assigned_services", "ip_address",
+    )
+    
+    def __init__(self, user_id: int, domain: str, profile: Union[Dict[str, Any], int],
+                 profiles: Sequence[Dict[str, Any]] = ()):
+        """Initialize a user.
+        
+        Args:
+            user_id: Numeric user id
+            domain: Email domain
+            profile: Profile settings, or an index into profiles
+            profiles: The run's profile table, shared by all of its users,
+                e.g. tuple(config.user_profiles)
+        """
         self.id = user_id
         self.domain = domain
-        self.profile = profile
+        if isinstance(profile, int):
+            self.profiles = profiles
+            self.profile_id = profile
+        else:
+            self.profiles = (profile,)
+            self.profile_id = 0
         self.username = f"user{user_id}"
         self.email = f"{self.username}@{domain}"
         self.assigned_services: Set[str] = set()
         self.ip_address = self._generate_ip()
     
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """Profile settings, looked up in the run's profile table."""
+        return self.profiles[self.profile_id]
+    
     def _generate_ip(self) -> str:
         """Generate a random internal IP address."""
         return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
@@ -24,11 +52,7 @@ class User:
         """Assign services to user based on profile."""
         for service in services:
             # Simple adoption logic
-            adoption_rate = service.user_adoption_rate
-            if service.status == "sanctioned":
-                adoption_rate *= 1.2
-            elif service.status == "blocked":
-                adoption_rate *= 0.1
+            adoption_rate = service.user_adoption_rate * _STATUS_ADOPTION_FACTORS.get(service.status, 1.0)
             
             if random.random() < adoption_rate:
                 self.assigned_services.add(service.name)
@@ -5,6 +5,7 @@ including loading predefined services and selecting services based on
 various criteria.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import random
@@ -16,6 +17,29 @@ from .categories import ServiceCategory
 
 logger = logging.getLogger(__name__)
 
+# Substrings of lowercased category names, by risk level
+_HIGH_RISK_CATEGORIES = (
+    'file sharing', 'personal storage', 'social media',
+    'personal email', 'vpn', 'proxy', 'torrent'
+)
+
+_MEDIUM_RISK_CATEGORIES = (
+    'collaboration', 'messaging', 'video conferencing',
+    'development tools', 'cloud storage'
+)
+
+
+@lru_cache(maxsize=None)
+def _category_risk_level(category: str) -> str:
+    """Risk level of a sanctioned service's category, memoized per category string."""
+    category = category.lower()
+    if any(cat in category for cat in _HIGH_RISK_CATEGORIES):
+        return 'high'
+    elif any(cat in category for cat in _MEDIUM_RISK_CATEGORIES):
+        return 'medium'
+    else:
+        return 'low'
+
 
 class ServiceManager:
     """Manages cloud service definitions and selection.
@@ -35,6 +59,17 @@ class ServiceManager:
     
     def _categorize_services(self):
         """Organize services by various attributes for efficient selection."""
+        # Small integer id per service, passed to Session for packed session ids
+        self.service_ids: Dict[str, int] = {
+            service.name: i for i, service in enumerate(self.services)
+        }
+        
+        # Lookup by name; built in reverse so the first service with a
+        # given name wins
+        self.by_name: Dict[str, CloudService] = {
+            service.name: service for service in reversed(self.services)
+        }
+        
         # Group by category
         self.by_category: Dict[str, List[CloudService]] = {}
         for service in self.services:
@@ -76,24 +111,7 @@ class ServiceManager:
             return 'high'
         
         # Categorize based on service category
-        category = service.category.lower()
-        
-        high_risk_categories = [
-            'file sharing', 'personal storage', 'social media',
-            'personal email', 'vpn', 'proxy', 'torrent'
-        ]
-        
-        medium_risk_categories = [
-            'collaboration', 'messaging', 'video conferencing',
-            'development tools', 'cloud storage'
-        ]
-        
-        if any(cat in category for cat in high_risk_categories):
-            return 'high'
-        elif any(cat in category for cat in medium_risk_categories):
-            return 'medium'
-        else:
-            return 'low'
+        return _category_risk_level(service.category)
     
     def select_services_for_user(self,
                                 user_type: str,
@@ -112,7 +130,8 @@ class ServiceManager:
         if user_type == 'risky' or prefer_risky:
             # Risky users access more blocked/high-risk services
             pool = self.services  # All services
-            weights = [3 if s in self.high_risk else 1 for s in pool]
+            high_risk = set(self.high_risk)
+            weights = [3 if s in high_risk else 1 for s in pool]
         elif user_type == 'power':
             # Power users access mix of services
             pool = self.sanctioned + random.sample(
@@ -135,13 +154,15 @@ class ServiceManager:
             selected = random.choices(pool, weights=weights, k=count)
             # Remove duplicates while preserving general distribution
             selected = list(dict.fromkeys(selected))
+            seen = set(selected)
             
             # If we need more due to duplicates, add more
             while len(selected) < count and len(selected) < len(pool):
                 additional = random.choices(pool, weights=weights, k=count-len(selected))
                 for service in additional:
-                    if service not in selected:
+                    if service not in seen:
                         selected.append(service)
+                        seen.add(service)
         else:
             selected = random.sample(pool, count)
         
@@ -174,12 +195,7 @@ class ServiceManager:
             'Microsoft Azure', 'ServiceNow', 'Workday', 'DocuSign'
         ]
         
-        popular = []
-        for name in popular_names:
-            for service in self.services:
-                if service.name == name:
-                    popular.append(service)
-                    break
+        popular = [self.by_name[name] for name in popular_names if name in self.by_name]
         
         return popular[:count]
     
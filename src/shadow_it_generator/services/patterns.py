@@ -1,22 +1,44 @@
 """Service access patterns and behaviors."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Optional, Tuple
 from datetime import datetime, time
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..models.cloud_service import CloudService
 
 
+# Activity multiplier ranges by time of day
+_PEAK_RANGE = (1.5, 2.0)
+_ACTIVE_RANGE = (0.8, 1.2)  # Business/active hours, 6:00-22:59
+_NIGHT_RANGE = (0.1, 0.3)
+
+# Resolved access patterns, keyed on (service name, category)
+_pattern_cache: Dict[Tuple[str, str], "AccessPattern"] = {}
+
+
 @dataclass
 class AccessPattern:
     """Defines access pattern for a service."""
-    peak_hours: List[int]  # Hours with peak usage (0-23)
+    peak_hours: FrozenSet[int]  # Hours with peak usage (0-23)
     min_requests_per_session: int
     max_requests_per_session: int
     session_duration_minutes: Tuple[int, int]  # Min, max duration
     burst_probability: float  # Probability of burst activity
     burst_multiplier: float  # Request multiplier during bursts
+    
+    # Activity multiplier range for each hour of the day, derived from peak_hours
+    hour_ranges: Tuple[Tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Store peak hours as a frozenset and build the per-hour range table."""
+        self.peak_hours = frozenset(self.peak_hours)
+        self.hour_ranges = tuple(
+            _PEAK_RANGE if hour in self.peak_hours
+            else _ACTIVE_RANGE if 6 <= hour <= 22
+            else _NIGHT_RANGE
+            for hour in range(24)
+        )
 
 
 class ServicePattern:
@@ -200,15 +222,23 @@ class ServicePattern:
         Returns:
             AccessPattern for the service
         """
+        key = (service.name, service.category)
+        pattern = _pattern_cache.get(key)
+        if pattern is not None:
+            return pattern
+        
         # Check for service-specific override first
         if service.name in cls.SERVICE_OVERRIDES:
-            return cls.SERVICE_OVERRIDES[service.name]
+            pattern = cls.SERVICE_OVERRIDES[service.name]
+        else:
+            # Fall back to category pattern
+            pattern = cls.CATEGORY_PATTERNS.get(
+                service.category,
+                cls.CATEGORY_PATTERNS["productivity"]  # Default pattern
+            )
         
-        # Fall back to category pattern
-        return cls.CATEGORY_PATTERNS.get(
-            service.category,
-            cls.CATEGORY_PATTERNS["productivity"]  # Default pattern
-        )
+        _pattern_cache[key] = pattern
+        return pattern
     
     @classmethod
     def is_peak_hour(cls, service: CloudService, hour: int) -> bool:
@@ -236,15 +266,8 @@ class ServicePattern:
         Returns:
             Multiplier for activity level (0.1 to 2.0)
         """
-        hour = current_time.hour
-        pattern = cls.get_pattern(service)
-        
-        if hour in pattern.peak_hours:
-            return random.uniform(1.5, 2.0)
-        elif 6 <= hour <= 22:  # Business/active hours
-            return random.uniform(0.8, 1.2)
-        else:  # Night hours
-            return random.uniform(0.1, 0.3)
+        low, high = cls.get_pattern(service).hour_ranges[current_time.hour]
+        return random.uniform(low, high)
     
     @classmethod
     def should_burst(cls, service: CloudService) -> bool:
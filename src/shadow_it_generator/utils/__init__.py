@@ -7,11 +7,10 @@ throughout the application.
 
 from .logger import setup_logging
 from .ip_generator import IPGenerator
-from .time_utils import generate_timestamps, working_hours_weight
+from .rng import numpy_rng
 
 __all__ = [
     "setup_logging",
     "IPGenerator",
-    "generate_timestamps",
-    "working_hours_weight",
+    "numpy_rng",
 ]
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Helpers for running on every supported Python version.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+
+
+def slotted_dataclass(cls: type) -> type:
+    """
+    Class decorator for a dataclass with __slots__.
+
+    Uses dataclass(slots=True) where available (Python 3.10+) and performs
+    the same class rebuild by hand on older versions.
+
+    Args:
+        cls: Class to turn into a dataclass
+
+    Returns:
+        The slotted dataclass
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    return _add_slots(dataclass(cls))
+
+
+def _add_slots(cls: type) -> type:
+    """Rebuild a dataclass with a slot per field, as slots=True does."""
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    # Defaults are baked into __init__; as class attributes they would
+    # clash with the slots
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
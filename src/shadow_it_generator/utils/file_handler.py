@@ -6,14 +6,24 @@ and compression support.
 
 import gzip
 import os
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Union
+from typing import DefaultDict, Dict, List, Optional, Union
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# File pattern placeholders and their strftime equivalents
+_PLACEHOLDER_DIRECTIVES = {
+    '{year}': '%Y',
+    '{month}': '%m',
+    '{day}': '%d',
+    '{hour}': '%H',
+    '{timestamp}': '%Y%m%d_%H%M%S',
+}
+
 
 class FileHandler:
     """Handles log file writing with rotation and compression.
@@ -39,6 +49,11 @@ class FileHandler:
         """
         self.output_dir = Path(output_dir)
         self.file_pattern = file_pattern
+        self._strftime_pattern = self._to_strftime(file_pattern)
+        # Paths only change hourly unless the pattern embeds the full timestamp
+        self._cache_by_hour = '{timestamp}' not in file_pattern
+        self._last_key = None
+        self._last_path = None
         self.rotation = rotation
         self.compress = compress
         self.current_file = None
@@ -72,6 +87,48 @@ class FileHandler:
         if self.entries_written % 1000 == 0:
             self.current_file.flush()
     
+    def write_batch(self, log_entries: List[str], timestamp: datetime):
+        """Write several log entries that share a file in one call.
+        
+        Args:
+            log_entries: Formatted log strings destined for the same file
+            timestamp: Representative timestamp for file organization
+        """
+        if not log_entries:
+            return
+        
+        file_path = self._get_file_path(timestamp)
+        
+        if self._should_rotate(file_path, timestamp):
+            self._rotate_file()
+        
+        if self.current_file is None:
+            self._open_file(file_path)
+        
+        self.current_file.write('\n'.join(log_entries) + '\n')
+        
+        # Flush whenever the batch crosses a 1000-entry boundary
+        written_before = self.entries_written
+        self.entries_written += len(log_entries)
+        if self.entries_written // 1000 != written_before // 1000:
+            self.current_file.flush()
+    
+    @staticmethod
+    def _to_strftime(file_pattern: str) -> str:
+        """Translate a placeholder file pattern into a strftime format.
+        
+        Args:
+            file_pattern: File naming pattern with placeholders
+            
+        Returns:
+            Equivalent strftime format string
+        """
+        # Escape literal percent signs before introducing directives
+        pattern = file_pattern.replace('%', '%%')
+        for placeholder, directive in _PLACEHOLDER_DIRECTIVES.items():
+            pattern = pattern.replace(placeholder, directive)
+        return pattern
+    
     def _get_file_path(self, timestamp: datetime) -> Path:
         """Generate file path based on timestamp and pattern.
         
@@ -81,20 +138,15 @@ class FileHandler:
         Returns:
             Path object for the log file
         """
-        # Replace placeholders in pattern
-        replacements = {
-            '{year}': str(timestamp.year),
-            '{month}': f"{timestamp.month:02d}",
-            '{day}': f"{timestamp.day:02d}",
-            '{hour}': f"{timestamp.hour:02d}",
-            '{timestamp}': timestamp.strftime('%Y%m%d_%H%M%S')
-        }
+        if not self._cache_by_hour:
+            return self.output_dir / timestamp.strftime(self._strftime_pattern)
         
-        file_name = self.file_pattern
-        for placeholder, value in replacements.items():
-            file_name = file_name.replace(placeholder, value)
-        
-        return self.output_dir / file_name
+        key = (timestamp.year * 1000000 + timestamp.month * 10000 +
+               timestamp.day * 100 + timestamp.hour)
+        if key != self._last_key:
+            self._last_path = self.output_dir / timestamp.strftime(self._strftime_pattern)
+            self._last_key = key
+        return self._last_path
     
     def _should_rotate(self, file_path: Path, timestamp: datetime) -> bool:
         """Check if file rotation is needed.
@@ -192,8 +244,11 @@ class BatchFileWriter:
         """
         self.file_handler = file_handler
         self.batch_size = batch_size
-        self.buffer = []
-        self.buffer_timestamps = []
+        # Buffered entries grouped by destination file, in arrival order
+        self.buffer: DefaultDict[Path, List[str]] = defaultdict(list)
+        # First timestamp seen for each file, used to route the group
+        self.group_timestamps: Dict[Path, datetime] = {}
+        self.buffered = 0
     
     def write_log(self, log_entry: str, timestamp: datetime):
         """Add log entry to buffer.
@@ -202,34 +257,27 @@ class BatchFileWriter:
             log_entry: Formatted log string
             timestamp: Log timestamp
         """
-        self.buffer.append(log_entry)
-        self.buffer_timestamps.append(timestamp)
+        file_path = self.file_handler._get_file_path(timestamp)
+        self.buffer[file_path].append(log_entry)
+        self.group_timestamps.setdefault(file_path, timestamp)
+        self.buffered += 1
         
-        if len(self.buffer) >= self.batch_size:
+        if self.buffered >= self.batch_size:
             self.flush()
     
     def flush(self):
         """Write buffered entries to disk."""
-        if not self.buffer:
+        if not self.buffered:
             return
         
-        # Group by file to minimize file operations
-        file_groups = {}
-        
-        for entry, timestamp in zip(self.buffer, self.buffer_timestamps):
-            file_path = self.file_handler._get_file_path(timestamp)
-            if file_path not in file_groups:
-                file_groups[file_path] = []
-            file_groups[file_path].append((entry, timestamp))
-        
-        # Write each group
-        for entries in file_groups.values():
-            for entry, timestamp in entries:
-                self.file_handler.write_log(entry, timestamp)
+        # One write per destination file
+        for file_path, entries in self.buffer.items():
+            self.file_handler.write_batch(entries, self.group_timestamps[file_path])
         
         # Clear buffer
         self.buffer.clear()
-        self.buffer_timestamps.clear()
+        self.group_timestamps.clear()
+        self.buffered = 0
     
     def close(self):
         """Flush remaining entries and close."""
@@ -3,8 +3,39 @@ IP address generator for creating realistic network traffic patterns.
 """
 
 import random
+import socket
+from bisect import bisect_right
+from itertools import accumulate
+import struct
 import ipaddress
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .rng import numpy_rng
+
+
+_pack_ipv4 = struct.Struct('!I').pack
+
+
+def _ipv4_str(value: int) -> str:
+    """Render an integer IPv4 address in dotted-quad form."""
+    return socket.inet_ntoa(_pack_ipv4(value))
+
+
+def _ipv6_str(value: int) -> str:
+    """Render an integer IPv6 address in compressed form."""
+    return str(ipaddress.IPv6Address(value))
+
+
+# (integer base address, number of addresses, formatter) for one network
+NetworkBase = Tuple[int, int, Callable[[int], str]]
+
+
+def _network_base(network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]) -> NetworkBase:
+    """Reduce a network to the integers needed to draw hosts from it."""
+    to_str = _ipv4_str if network.version == 4 else _ipv6_str
+    return int(network.network_address), network.num_addresses, to_str
 
 
 class IPGenerator:
@@ -45,33 +76,101 @@ class IPGenerator:
             ipaddress.ip_network("172.217.0.0/16"),   # Google
             ipaddress.ip_network("142.250.0.0/15"),   # Google
         ]
+        
+        # Integer forms of the networks for the per-call generators
+        self._internal_bases = [_network_base(network) for network in self.internal_networks]
+        # Cumulative address counts, so subnets are picked in proportion to size
+        self._internal_cum = list(accumulate(num for _, num, _ in self._internal_bases))
+        self._internal_total = self._internal_cum[-1] if self._internal_cum else 0
+        # The same tables as arrays for generate_internal_ips; IPv6 addresses
+        # don't fit in int64, so only all-IPv4 configurations get them
+        self._internal_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        if self._internal_bases and all(network.version == 4 for network in self.internal_networks):
+            self._internal_arrays = (
+                np.array([base for base, _, _ in self._internal_bases], dtype=np.int64),
+                np.array([num for _, num, _ in self._internal_bases], dtype=np.int64),
+                np.array(self._internal_cum, dtype=np.int64),
+            )
+        self._vpn_bases = [_network_base(network) for network in self.vpn_networks]
+        self._cdn_bases = [_network_base(network) for network in self.cdn_ranges]
+        self._service_bases: Dict[str, NetworkBase] = {}
+        self._egress_strs = [str(ip) for ip in self.egress_ips]
+        self._proxy_strs = [str(ip) for ip in self.proxy_ips]
+        
+        # Generator for the batched draws, reused across calls
+        self._rng = numpy_rng()
     
     def generate_internal_ip(self, exclude_servers: bool = True) -> str:
         """
         Generate a random internal IP address.
         
+        Subnets are chosen in proportion to their number of addresses.
+        
         Args:
             exclude_servers: If True, avoid .1-.10 addresses (typically servers)
             
         Returns:
             Internal IP address as string
         """
-        network = random.choice(self.internal_networks)
+        idx = bisect_right(self._internal_cum, random.random() * self._internal_total)
+        base, num_addresses, to_str = self._internal_bases[idx]
         
         # Generate random host within the network
-        if network.num_addresses > 2:
+        if num_addresses > 2:
             if exclude_servers:
                 # Skip first 10 and last address
-                host_offset = random.randint(11, network.num_addresses - 2)
+                host_offset = random.randint(11, num_addresses - 2)
             else:
                 # Skip network and broadcast addresses
-                host_offset = random.randint(1, network.num_addresses - 2)
+                host_offset = random.randint(1, num_addresses - 2)
             
-            ip = network.network_address + host_offset
-            return str(ip)
+            return to_str(base + host_offset)
         else:
             # Small network, just return first usable
-            return str(list(network.hosts())[0])
+            return to_str(base)
+    
+    def generate_internal_ips(self, count: int, exclude_servers: bool = True) -> List[str]:
+        """
+        Generate many internal IP addresses in one vectorized pass.
+        
+        Follows the same rules as generate_internal_ip(), but the network
+        choice and host offsets are drawn as NumPy arrays.
+        
+        Args:
+            count: Number of addresses to generate
+            exclude_servers: If True, avoid .1-.10 addresses (typically servers)
+            
+        Returns:
+            List of internal IP addresses as strings
+            
+        Raises:
+            ValueError: If a chosen subnet has no host addresses to draw from,
+                as generate_internal_ip() does
+        """
+        if count <= 0:
+            return []
+        
+        if self._internal_arrays is None:
+            return [self.generate_internal_ip(exclude_servers) for _ in range(count)]
+        
+        rng = self._rng
+        bases, sizes, cum = self._internal_arrays
+        
+        net_idx = np.searchsorted(cum, rng.random(count) * self._internal_total, side='right')
+        net_sizes = sizes[net_idx]
+        low = 11 if exclude_servers else 1
+        
+        # Small networks fall back to their first usable host
+        large = net_sizes > 2
+        too_small = large & (net_sizes - 2 < low)
+        if too_small.any():
+            network = self.internal_networks[int(net_idx[too_small.argmax()])]
+            raise ValueError(f"Subnet {network} has no host addresses from offset {low}")
+        offsets = np.where(large, rng.integers(low, np.maximum(net_sizes - 1, low + 1)), 0)
+        addrs = bases[net_idx] + offsets
+        
+        octets = [(addrs >> shift) & 0xFF for shift in (24, 16, 8, 0)]
+        return [f"{a}.{b}.{c}.{d}" for a, b, c, d in zip(*(o.tolist() for o in octets))]
     
     def generate_vpn_ip(self) -> Optional[str]:
         """
@@ -80,16 +179,15 @@ class IPGenerator:
         Returns:
             VPN IP address or None if no VPN configured
         """
-        if not self.vpn_networks:
+        if not self._vpn_bases:
             return None
             
-        network = random.choice(self.vpn_networks)
-        if network.num_addresses > 2:
-            host_offset = random.randint(1, network.num_addresses - 2)
-            ip = network.network_address + host_offset
-            return str(ip)
+        base, num_addresses, to_str = random.choice(self._vpn_bases)
+        if num_addresses > 2:
+            host_offset = random.randint(1, num_addresses - 2)
+            return to_str(base + host_offset)
         else:
-            return str(list(network.hosts())[0])
+            return to_str(base)
     
     def get_egress_ip(self, use_proxy: bool = False) -> str:
         """
@@ -101,10 +199,10 @@ class IPGenerator:
         Returns:
             Egress IP address as string
         """
-        if use_proxy and self.proxy_ips:
-            return str(random.choice(self.proxy_ips))
+        if use_proxy and self._proxy_strs:
+            return random.choice(self._proxy_strs)
         else:
-            return str(random.choice(self.egress_ips))
+            return random.choice(self._egress_strs)
     
     def generate_destination_ip(self, service_ip_ranges: Optional[List[str]] = None) -> str:
         """
@@ -119,20 +217,22 @@ class IPGenerator:
         if service_ip_ranges:
             # Use service-specific ranges
             ip_range = random.choice(service_ip_ranges)
-            network = ipaddress.ip_network(ip_range)
+            network_base = self._service_bases.get(ip_range)
+            if network_base is None:
+                network_base = _network_base(ipaddress.ip_network(ip_range))
+                self._service_bases[ip_range] = network_base
+            base, num_addresses, to_str = network_base
             
-            if network.num_addresses > 2:
-                host_offset = random.randint(1, network.num_addresses - 2)
-                ip = network.network_address + host_offset
-                return str(ip)
+            if num_addresses > 2:
+                host_offset = random.randint(1, num_addresses - 2)
+                return to_str(base + host_offset)
             else:
-                return str(network.network_address)
+                return to_str(base)
         else:
             # Use CDN ranges
-            network = random.choice(self.cdn_ranges)
-            host_offset = random.randint(1, min(1000, network.num_addresses - 2))
-            ip = network.network_address + host_offset
-            return str(ip)
+            base, num_addresses, to_str = random.choice(self._cdn_bases)
+            host_offset = random.randint(1, min(1000, num_addresses - 2))
+            return to_str(base + host_offset)
     
     def generate_source_port(self, privileged: bool = False) -> int:
         """
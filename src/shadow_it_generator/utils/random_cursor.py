@@ -0,0 +1,71 @@
+"""
+Buffered random number source for hot generation loops.
+
+Hands out uniform draws from a block pre-drawn with NumPy, so per-event
+code pays a list index instead of a call into the Mersenne Twister.
+"""
+
+from bisect import bisect_right
+from typing import Any, List, Sequence
+
+import numpy as np
+
+
+class RandomCursor:
+    """
+    Sequential reader over a block of pre-drawn uniform floats.
+    
+    Implements the subset of the random module's interface used by the
+    generators (random, randint, choice, choices with cum_weights), so it
+    can be passed wherever the module itself would be used. The block is
+    refilled from the NumPy generator when exhausted.
+    """
+    
+    def __init__(self, rng: np.random.Generator, size: int = 4096):
+        """
+        Initialize the cursor.
+        
+        Args:
+            rng: NumPy generator the blocks are drawn from
+            size: Number of floats drawn per block
+        """
+        self._rng = rng
+        self._size = max(1, size)
+        self._buffer: List[float] = []
+        self._pos = 0
+    
+    def random(self) -> float:
+        """Return the next float in [0, 1)."""
+        pos = self._pos
+        if pos == len(self._buffer):
+            self._buffer = self._rng.random(self._size).tolist()
+            pos = 0
+        self._pos = pos + 1
+        return self._buffer[pos]
+    
+    def randint(self, a: int, b: int) -> int:
+        """Return an integer in [a, b], inclusive."""
+        return a + int(self.random() * (b - a + 1))
+    
+    def choice(self, seq: Sequence[Any]) -> Any:
+        """Return a uniformly chosen element of a non-empty sequence."""
+        return seq[int(self.random() * len(seq))]
+    
+    def choices(self, population: Sequence[Any], cum_weights: Sequence[float], k: int = 1) -> List[Any]:
+        """
+        Return k elements chosen with the given cumulative weights.
+        
+        Args:
+            population: Elements to choose from
+            cum_weights: Cumulative weights, one per element
+            k: Number of elements to return
+        
+        Returns:
+            List of chosen elements
+        """
+        total = cum_weights[-1]
+        hi = len(population) - 1
+        return [
+            population[min(bisect_right(cum_weights, self.random() * total), hi)]
+            for _ in range(k)
+        ]
\ No newline at end of file
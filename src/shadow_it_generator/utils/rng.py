@@ -0,0 +1,22 @@
+"""
+NumPy random generators tied to the stdlib random module.
+"""
+
+import random
+
+import numpy as np
+
+
+def numpy_rng() -> np.random.Generator:
+    """
+    Create a NumPy generator seeded from the stdlib random module.
+
+    Seeding from random keeps runs reproducible under random.seed() while
+    bulk draws go through NumPy. Creating a generator costs far more than a
+    draw, so callers create one up front (typically per instance) and reuse
+    it rather than calling this per event.
+
+    Returns:
+        A new PCG64-backed generator
+    """
+    return np.random.default_rng(random.getrandbits(64))
\ No newline at end of file
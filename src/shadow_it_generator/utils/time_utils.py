@@ -4,8 +4,9 @@ Time-related utilities for log generation.
 Handles working hours, weekends, holidays, and time-based activity patterns.
 """
 
-from datetime import datetime, time, timedelta
-from typing import List, Tuple, Optional
+from datetime import datetime, time, timedelta, tzinfo
+from functools import lru_cache
+from typing import List, Tuple, Optional, Union
 import random
 import numpy as np
 from zoneinfo import ZoneInfo
@@ -54,7 +55,7 @@ def get_activity_multiplier(
     work_start: time = time(8, 0),
     work_end: time = time(18, 0),
     lunch_hour: int = 12,
-    timezone: str = "America/New_York"
+    timezone: Union[str, tzinfo] = "America/New_York"
 ) -> float:
     """
     Get activity multiplier based on time of day.
@@ -66,20 +67,55 @@ def get_activity_multiplier(
         work_start: Start of working hours
         work_end: End of working hours
         lunch_hour: Hour of lunch break (24-hour format)
-        timezone: Timezone for calculations
+        timezone: Timezone name, or a resolved tzinfo to skip the lookup
         
     Returns:
         Activity multiplier between 0 and 1
     """
     # Convert to local timezone
-    local_time = timestamp.astimezone(ZoneInfo(timezone))
+    if isinstance(timezone, str):
+        timezone = ZoneInfo(timezone)
+    local_time = timestamp.astimezone(timezone)
+    
+    return _local_activity_multiplier(
+        local_time.weekday(),
+        local_time.hour,
+        local_time.minute,
+        work_start,
+        work_end,
+        lunch_hour
+    )
+
+
+@lru_cache(maxsize=512)
+def _local_activity_multiplier(
+    weekday: int,
+    hour: int,
+    minute: int,
+    work_start: time,
+    work_end: time,
+    lunch_hour: int
+) -> float:
+    """
+    Activity multiplier for a local weekday and time of day.
+    
+    The multiplier depends only on these values, so results are memoized.
     
+    Args:
+        weekday: Local weekday (0 = Monday)
+        hour: Local hour
+        minute: Local minute
+        work_start: Start of working hours
+        work_end: End of working hours
+        lunch_hour: Hour of lunch break (24-hour format)
+        
+    Returns:
+        Activity multiplier between 0 and 1
+    """
     # Weekend activity is much lower
-    if is_weekend(local_time):
+    if weekday >= 5:  # 5 = Saturday, 6 = Sunday
         return 0.1
     
-    hour = local_time.hour
-    minute = local_time.minute
     decimal_hour = hour + minute / 60.0
     
     # Convert work hours to decimal
@@ -5,7 +5,9 @@ Generates both US and international names in firstname.lastname@domain format.
 """
 
 import random
-from typing import List, Tuple, Dict, Set
+import string
+from collections import Counter
+from typing import List, Tuple, Dict, Set, Optional
 from faker import Faker
 
 
@@ -16,7 +18,7 @@ class UserGenerator:
     Creates email addresses in the format: firstname.lastname@domain
     """
     
-    def __init__(self, enterprise_domain: str, seed: int = None):
+    def __init__(self, enterprise_domain: str, seed: Optional[int] = None):
         """
         Initialize the user generator.
         
@@ -27,9 +29,11 @@ class UserGenerator:
         self.enterprise_domain = enterprise_domain
         self.generated_emails: Set[str] = set()
         
-        if seed:
-            random.seed(seed)
-            Faker.seed(seed)
+        # Private RNG; without an explicit seed it is seeded from the global
+        # random module so random.seed() still reproduces the names
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._rng = random.Random(seed)
         
         # Initialize Faker instances for different locales
         self.locales = {
@@ -79,6 +83,14 @@ class UserGenerator:
             }
         }
         
+        # Preload name pools from each locale's Faker person provider so
+        # names can be sampled in bulk instead of one Faker call at a time
+        for info in self.locales.values():
+            info.update(self._build_name_pools(info['faker']))
+        
+        self._locale_names = list(self.locales.keys())
+        self._locale_weights = [self.locales[loc]['weight'] for loc in self._locale_names]
+        
         # Common name variations that might exist
         self.common_variations = [
             ('john', 'j'),
@@ -122,12 +134,85 @@ class UserGenerator:
         
         return name
     
-    def _select_locale(self) -> Tuple[str, Faker]:
+    @staticmethod
+    def _build_name_pools(faker: Faker) -> Dict[str, Optional[tuple]]:
+        """
+        Extract first/last name tables from a Faker person provider.
+        
+        Some locales store names as weighted mappings; those weights are kept
+        so bulk sampling follows the same distribution as Faker itself.
+        """
+        provider = next(p for p in faker.providers if hasattr(p, 'first_names'))
+        pools = {}
+        for kind in ('first', 'last'):
+            table = getattr(provider, f'{kind}_names')
+            if isinstance(table, dict):
+                pools[f'{kind}_names'] = tuple(table.keys())
+                pools[f'{kind}_weights'] = tuple(table.values())
+            else:
+                pools[f'{kind}_names'] = tuple(table)
+                pools[f'{kind}_weights'] = None
+        return pools
+    
+    def _sample_names(self, locale: str, k: int) -> List[Tuple[str, str]]:
+        """Draw k (first, last) name pairs for a locale in one pass."""
+        info = self.locales[locale]
+        firsts = self._rng.choices(info['first_names'], weights=info['first_weights'], k=k)
+        lasts = self._rng.choices(info['last_names'], weights=info['last_weights'], k=k)
+        return list(zip(firsts, lasts))
+    
+    def _select_locale(self) -> str:
         """Select a locale based on weighted distribution."""
-        locales = list(self.locales.keys())
-        weights = [self.locales[loc]['weight'] for loc in locales]
-        selected = random.choices(locales, weights=weights)[0]
-        return selected, self.locales[selected]['faker']
+        return self._rng.choices(self._locale_names, weights=self._locale_weights)[0]
+    
+    def _build_user(self, locale: str, first_name: str, last_name: str) -> Optional[Dict[str, str]]:
+        """
+        Build a user record from a name pair.
+        
+        Returns:
+            User dictionary, or None if the email is already taken
+        """
+        # Normalize for email
+        first_normalized = self._normalize_name(first_name)
+        last_normalized = self._normalize_name(last_name)
+        
+        # Create email
+        username = f"{first_normalized}.{last_normalized}"
+        email = f"{username}@{self.enterprise_domain}"
+        
+        # Check for duplicates
+        if email in self.generated_emails:
+            return None
+        
+        self.generated_emails.add(email)
+        base_email = email
+        
+        # Sometimes add middle initial
+        if self._rng.random() < 0.1:  # 10% chance
+            middle_initial = self._rng.choice(string.ascii_letters).lower()
+            username = f"{first_normalized}.{middle_initial}.{last_normalized}"
+            email = f"{username}@{self.enterprise_domain}"
+        
+        # Sometimes add number for common names
+        elif email in self.generated_emails or self._rng.random() < 0.05:
+            number = self._rng.randint(1, 99)
+            username = f"{first_normalized}.{last_normalized}{number}"
+            email = f"{username}@{self.enterprise_domain}"
+        
+        # The decorated address has to be unique as well
+        if email != base_email:
+            if email in self.generated_emails:
+                return None
+            self.generated_emails.add(email)
+        
+        return {
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': email,
+            'username': username,
+            'locale': locale,
+            'full_name': f"{first_name} {last_name}"
+        }
     
     def generate_user(self) -> Dict[str, str]:
         """
@@ -142,52 +227,19 @@ class UserGenerator:
             - username: Just the username part (before @)
         """
         max_attempts = 100
-        attempts = 0
         
-        while attempts < max_attempts:
-            locale, faker = self._select_locale()
-            
-            # Generate names
-            first_name = faker.first_name()
-            last_name = faker.last_name()
-            
-            # Normalize for email
-            first_normalized = self._normalize_name(first_name)
-            last_normalized = self._normalize_name(last_name)
-            
-            # Create email
-            username = f"{first_normalized}.{last_normalized}"
-            email = f"{username}@{self.enterprise_domain}"
-            
-            # Check for duplicates
-            if email not in self.generated_emails:
-                self.generated_emails.add(email)
-                
-                # Sometimes add middle initial
-                if random.random() < 0.1:  # 10% chance
-                    middle_initial = faker.random_letter().lower()
-                    username = f"{first_normalized}.{middle_initial}.{last_normalized}"
-                    email = f"{username}@{self.enterprise_domain}"
-                
-                # Sometimes add number for common names
-                elif email in self.generated_emails or random.random() < 0.05:
-                    number = random.randint(1, 99)
-                    username = f"{first_normalized}.{last_normalized}{number}"
-                    email = f"{username}@{self.enterprise_domain}"
-                
-                return {
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'email': email,
-                    'username': username,
-                    'locale': locale,
-                    'full_name': f"{first_name} {last_name}"
-                }
+        for _ in range(max_attempts):
+            locale = self._select_locale()
+            first_name, last_name = self._sample_names(locale, 1)[0]
             
-            attempts += 1
+            user = self._build_user(locale, first_name, last_name)
+            if user is not None:
+                return user
         
         # Fallback with number
-        number = random.randint(1000, 9999)
+        first_normalized = self._normalize_name(first_name)
+        last_normalized = self._normalize_name(last_name)
+        number = self._rng.randint(1000, 9999)
         username = f"{first_normalized}.{last_normalized}{number}"
         email = f"{username}@{self.enterprise_domain}"
         
@@ -200,6 +252,43 @@ class UserGenerator:
             'full_name': f"{first_name} {last_name}"
         }
     
+    def _generate_named_users(self, count: int) -> List[Dict[str, str]]:
+        """
+        Generate count unique (non-service) users.
+        
+        Args:
+            count: Number of users to generate
+            
+        Returns:
+            List of user dictionaries
+        """
+        users = []
+        
+        # Draw locales and names in bulk, redrawing only for the (rare)
+        # duplicate emails
+        max_attempts = 100
+        for _ in range(max_attempts):
+            needed = count - len(users)
+            if needed <= 0:
+                break
+            
+            locales = self._rng.choices(self._locale_names, weights=self._locale_weights, k=needed)
+            names_by_locale = {}
+            for locale, locale_count in Counter(locales).items():
+                names_by_locale[locale] = self._sample_names(locale, locale_count)
+            
+            for locale in locales:
+                first_name, last_name = names_by_locale[locale].pop()
+                user = self._build_user(locale, first_name, last_name)
+                if user is not None:
+                    users.append(user)
+        
+        # Anything still missing goes through the single-user fallback path
+        while len(users) < count:
+            users.append(self.generate_user())
+        
+        return users
+    
     def generate_users(self, count: int) -> List[Dict[str, str]]:
         """
         Generate multiple unique users.
@@ -246,9 +335,7 @@ class UserGenerator:
                 users.append(account)
                 self.generated_emails.add(account['email'])
         
-        # Generate remaining users
-        while len(users) < count:
-            users.append(self.generate_user())
+        users.extend(self._generate_named_users(count - len(users)))
         
         return users
     
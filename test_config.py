@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Tests for the configuration parser."""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from shadow_it_generator.config.parser import ConfigParser
+
+SERVICES_DIR = Path(__file__).parent / 'config' / 'cloud-services'
+
+
+def test_consolidated_services_follow_yaml_changes(tmp_path):
+    """The JSONL cache is ignored once YAML files are removed or added."""
+    for name in ('dropbox.yaml', 'slack.yaml'):
+        shutil.copy2(SERVICES_DIR / name, tmp_path / name)
+    parser = ConfigParser()
+    parser.consolidate_services(tmp_path)
+
+    def service_names():
+        return sorted(s.name for s in parser.parse_services_directory(tmp_path))
+
+    both = service_names()
+    assert len(both) == 2
+
+    # A deleted YAML file must not keep loading from the cache
+    (tmp_path / 'slack.yaml').unlink()
+    assert len(service_names()) == 1
+
+    # An added file with an old mtime must still be picked up
+    shutil.copy2(SERVICES_DIR / 'slack.yaml', tmp_path / 'slack.yaml')
+    os.utime(tmp_path / 'slack.yaml', (0, 0))
+    assert service_names() == both
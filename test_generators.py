@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the traffic generators."""
+
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+# core must be imported before generators: each package's __init__ imports
+# the other, and only this order resolves
+import shadow_it_generator.core  # noqa: F401
+from shadow_it_generator.generators.junk_traffic import JunkTrafficGenerator
+from shadow_it_generator.generators.response import FileType, ResponseGenerator
+from shadow_it_generator.generators.traffic import TrafficPatternLibrary
+from shadow_it_generator.utils.ip_generator import IPGenerator
+from shadow_it_generator.utils.user_generator import UserGenerator
+
+
+def test_batch_response_sizes_match_scalar_path():
+    """generate_responses sizes follow the same rules as _generate_response_size."""
+    random.seed(42)
+    generator = ResponseGenerator()
+    methods = ['GET', 'HEAD', 'POST', 'DELETE', 'PUT'] * 400
+    urls = ['https://example.com/page', 'https://example.com/api/v1/items',
+            'https://example.com/doc.pdf', 'https://example.com/logo.png'] * 500
+    is_allowed = [i % 7 != 0 for i in range(len(methods))]
+    is_api = ['/api/' in url for url in urls]
+
+    status_codes, _, sizes, _ = generator.generate_responses(methods, urls, is_allowed, is_api)
+
+    for method, url, allowed, api, status, size in zip(
+            methods, urls, is_allowed, is_api, status_codes.tolist(), sizes.tolist()):
+        if not allowed:
+            assert status == 403 and 1000 <= size <= 5000
+            continue
+        file_type = generator._detect_file_type(url, api)
+        expected = generator._generate_response_size(method, status, file_type, api)
+        if expected == 0:
+            assert size == 0, (method, status)
+        elif status >= 400:
+            assert 200 <= size <= 2000, (method, status)
+        else:
+            if api and file_type is FileType.JSON:
+                min_size, max_size, _ = generator._api_json_size_params
+            else:
+                min_size, max_size, _ = generator._size_params.get(
+                    file_type, generator._default_size_params)
+            assert min_size <= size <= max_size, (method, status, file_type)
+
+    # Allowed HEAD requests never carry a body, whatever their status
+    head = [size for method, allowed, size in zip(methods, is_allowed, sizes.tolist())
+            if method == 'HEAD' and allowed]
+    assert head and not any(head)
+
+
+def test_user_names_follow_global_seed():
+    """Without an explicit seed, random.seed() reproduces the generated users."""
+    def emails():
+        random.seed(7)
+        return [user['email'] for user in UserGenerator('acmecorp.com').generate_users(50)]
+
+    assert emails() == emails()
+
+
+def test_batch_junk_events_keep_https_sites_on_443():
+    """Sites listed with an https:// scheme use port 443 in the batch path too."""
+    random.seed(11)
+    generator = JunkTrafficGenerator(
+        {
+            'requests_per_user_per_day': {'mean': 2400, 'std_dev': 0},
+            'categories': {'news': 1.0},
+        },
+        IPGenerator(['10.0.0.0/8'], ['203.0.113.5']),
+        'acmecorp.com'
+    )
+    generator._category_site_https = [[True] * len(domains) for domains in generator._category_domains]
+
+    events = generator.generate_user_junk_events(
+        'jane.doe@acmecorp.com', '10.0.0.5',
+        datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 10), 'Mozilla/5.0'
+    )
+
+    assert events
+    assert all(event.destination_port == 443 for event in events)
+
+
+def test_traffic_patterns_are_not_shared():
+    """Changing a returned pattern leaves later callers' patterns untouched."""
+    patterns = TrafficPatternLibrary.get_patterns()
+    patterns['chat'].burst_probability = 1.0
+    patterns['chat'].generate_request_size()
+
+    fresh = TrafficPatternLibrary.get_patterns()['chat']
+    assert fresh.burst_probability == 0.5
+    assert fresh._req_buf == []
+    assert TrafficPatternLibrary.get_pattern_for_category('email').burst_probability == 0.5
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for the data models."""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from shadow_it_generator.models.cloud_service import CloudService
+from shadow_it_generator.models.config import EnterpriseConfig
+from shadow_it_generator.models.log_entry import LogEntry
+from shadow_it_generator.models.session import Session
+from shadow_it_generator.models.user import User
+from shadow_it_generator.services.manager import ServiceManager
+
+
+@pytest.fixture
+def new_york_tz():
+    """Run the test with the host clock in a non-UTC timezone."""
+    old_tz = os.environ.get('TZ')
+    os.environ['TZ'] = 'America/New_York'
+    time.tzset()
+    yield
+    if old_tz is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = old_tz
+    time.tzset()
+
+
+def make_service(name='Slack'):
+    """Build a minimal service definition."""
+    return CloudService({
+        'service': {'name': name, 'category': 'communication', 'status': 'sanctioned'},
+        'network': {'domains': [f'{name.lower()}.com']},
+    })
+
+
+def test_request_timestamps_stay_in_session_frame(new_york_tz):
+    """Request times are datetimes in the same naive frame as the session start."""
+    start = datetime(2024, 3, 1, 9, 0, 0)
+    user = User(1, 'acmecorp.com', {'name': 'normal'})
+    session = Session(user, make_service(), start, service_id=0)
+
+    requests = session.generate_requests()
+
+    assert requests
+    for request in requests:
+        assert isinstance(request['timestamp'], datetime)
+        assert start < request['timestamp'] <= session.end_time
+
+    entry = LogEntry(requests[0]['timestamp'], user, session.service, 'browse', 'allowed')
+    assert entry.to_dict()['timestamp'].startswith('2024-03-01T09:')
+
+    # Epoch seconds render back in the same local frame
+    epoch_entry = LogEntry(int(start.timestamp()), user, session.service, 'browse', 'allowed')
+    assert epoch_entry.to_dict()['timestamp'] == '2024-03-01T09:00:00'
+
+
+def test_session_ids_are_unique():
+    """Packed session ids separate services and keep the full start time."""
+    manager = ServiceManager([make_service('Slack'), make_service('Dropbox')])
+    user = User(7, 'acmecorp.com', {'name': 'normal'})
+    start = datetime(2024, 3, 1, 9, 0, 0)
+
+    ids = {
+        Session(user, service, when, manager.service_ids[service.name]).session_id
+        for service in manager.services
+        # Low 24 bits of the timestamp wrap after 2**24 seconds
+        for when in (start, start + timedelta(seconds=2 ** 24))
+    }
+
+    assert len(ids) == 4
+
+
+def test_users_share_the_run_profile_table():
+    """Users index into the profile table passed in for their run."""
+    profiles = ({'name': 'normal'}, {'name': 'power'})
+    users = [User(i, 'acmecorp.com', i % 2, profiles) for i in range(4)]
+
+    assert [user.profile['name'] for user in users] == ['normal', 'power', 'normal', 'power']
+    assert all(user.profiles is profiles for user in users)
+
+    # A profile dict passed directly is kept with the user
+    profile = {'name': 'risky'}
+    assert User(9, 'acmecorp.com', profile).profile is profile
+
+
+def test_config_data_keeps_every_top_level_key():
+    """EnterpriseConfig.data returns the loaded config, not just the known sections."""
+    config_path = Path(__file__).parent / 'config' / 'enterprise.yaml'
+    with open(config_path) as f:
+        raw = yaml.safe_load(f)
+
+    data = EnterpriseConfig.from_yaml(config_path).data
+
+    assert 'policies' in raw
+    for key, value in raw.items():
+        assert data[key] == value
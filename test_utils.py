@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the utility helpers."""
+
+import ipaddress
+import random
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from shadow_it_generator.utils.compat import _add_slots
+from shadow_it_generator.utils.ip_generator import IPGenerator
+
+
+def test_hand_built_slots_keep_dataclass_defaults():
+    """The pre-3.10 slots rebuild keeps defaults and drops the instance dict."""
+    @dataclass
+    class Event:
+        name: str
+        tags: List[str] = field(default_factory=list)
+        referrer: Optional[str] = None
+
+    Event = _add_slots(Event)
+    event = Event('login')
+
+    assert Event.__slots__ == ('name', 'tags', 'referrer')
+    assert not hasattr(event, '__dict__')
+    assert event == Event('login', [], None)
+    assert Event('logout').tags is not event.tags
+
+
+def test_batch_internal_ips_stay_inside_small_subnets():
+    """generate_internal_ips follows generate_internal_ip on a /29."""
+    random.seed(3)
+    subnet = ipaddress.ip_network('192.168.5.0/29')
+    generator = IPGenerator([str(subnet)], ['203.0.113.5'])
+
+    ips = generator.generate_internal_ips(200, exclude_servers=False)
+
+    assert all(ipaddress.ip_address(ip) in subnet for ip in ips)
+    assert set(ips) <= {str(host) for host in subnet.hosts()}
+
+    # Too small to skip the server range: both paths refuse
+    with pytest.raises(ValueError):
+        generator.generate_internal_ip()
+    with pytest.raises(ValueError):
+        generator.generate_internal_ips(5)